@@ -49,6 +49,26 @@ class Settings(BaseSettings):
     EMAIL_HOST_PASSWORD: str = os.getenv("EMAIL_HOST_PASSWORD", "")
     DEFAULT_FROM_EMAIL: str = os.getenv("DEFAULT_FROM_EMAIL", "")
 
+    # Depreciation
+    POLICY_CACHE_TTL: int = int(os.getenv("POLICY_CACHE_TTL") or "300")
+    SCHEDULE_CACHE_SIZE: int = int(os.getenv("SCHEDULE_CACHE_SIZE") or "10000")
+    SCHEDULE_CACHE_TTL: int = int(os.getenv("SCHEDULE_CACHE_TTL") or "600")
+    DEPRECIATION_JOB_WORKERS: int = int(os.getenv("DEPRECIATION_JOB_WORKERS") or "2")
+    DEPRECIATION_JOB_CHUNK_SIZE: int = int(os.getenv("DEPRECIATION_JOB_CHUNK_SIZE") or "500")
+    DEPRECIATION_JOB_LEASE: int = int(os.getenv("DEPRECIATION_JOB_LEASE") or "120")
+    DEPRECIATION_JOB_POLL_INTERVAL: int = int(os.getenv("DEPRECIATION_JOB_POLL_INTERVAL") or "5")
+
+    # Maintenance status transitions (scheduled -> in_progress / incomplete)
+    MAINTENANCE_SCHEDULER_INTERVAL: int = int(os.getenv("MAINTENANCE_SCHEDULER_INTERVAL") or "300")
+    MAINTENANCE_SCHEDULER_BATCH_SIZE: int = int(os.getenv("MAINTENANCE_SCHEDULER_BATCH_SIZE") or "5000")
+
+    # Dashboard rollups (GET /api/assets/stats), cached per company
+    STATS_CACHE_SIZE: int = int(os.getenv("STATS_CACHE_SIZE") or "1000")
+    STATS_CACHE_TTL: int = int(os.getenv("STATS_CACHE_TTL") or "300")
+
+    # Business IDs (AST-/VEN-/MAIN-) reserved per process at a time
+    ID_BLOCK_SIZE: int = int(os.getenv("ID_BLOCK_SIZE") or "100")
+
     # Site Configuration
     DOMAIN: str = "asserter.vercel.app"
     SITE_NAME: str = "Asseter"
@@ -63,7 +83,7 @@ TORTOISE_ORM = {
     },
     "apps": {
         "models": {
-            "models": ["app.models.assets", "app.models.company", "app.models.depreciation", "app.models.user", "aerich.models"],
+            "models": ["app.models.assets", "app.models.company", "app.models.depreciation", "app.models.depreciation_history", "app.models.depreciation_job", "app.models.maintenance_cost", "app.models.change_version", "app.models.sequence", "app.models.user", "aerich.models"],
             "default_connection": "default",
         }
     }
@@ -11,6 +11,10 @@ TORTOISE_ORM = {
                 "app.models.assets",
                 "app.models.depreciation",
                 "app.models.depreciation_history",
+                "app.models.depreciation_job",
+                "app.models.maintenance_cost",
+                "app.models.change_version",
+                "app.models.sequence",
                 "aerich.models",
             ],
             "default_connection": "default",
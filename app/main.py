@@ -4,8 +4,11 @@ from contextlib import asynccontextmanager
 from app.config import settings
 from app.database import init_db
 from app.routes import user, company, assets, auth
-from app.routes.finance import depreciation_schedule, depreciation_setup, impairment_revaluation
+from app.routes.finance import depreciation_schedule, depreciation_setup, impairment_revaluation, depreciation_jobs, depreciation_posting, net_book_value
+from app.services.depreciation_jobs import depreciation_jobs as depreciation_job_runner
+from app.services.maintenance_scheduler import maintenance_scheduler
 from app.exceptions import custom_exception_handler
+from app.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import os
@@ -15,14 +18,19 @@ import os
 async def lifespan(app: FastAPI):
     print("🚀 Starting FastAPI Application...")
     await init_db()  # Initialize database
+    await depreciation_job_runner.start()  # Start depreciation job workers
+    await maintenance_scheduler.start()  # Start maintenance status updates
     yield  # Application is running
+    await maintenance_scheduler.stop()
+    await depreciation_job_runner.stop()
     print("🛑 Shutting down FastAPI Application...")
 
 # ✅ Initialize FastAPI with Lifespan
 app = FastAPI(
     title=settings.SITE_NAME, 
     description="API for managing company assets, transfers, disposals, and maintenance", 
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # ✅ CORS Configuration
@@ -46,6 +54,9 @@ app.include_router(assets.router, prefix="/api/assets", tags=["Assets"], respons
 app.include_router(depreciation_setup.router, prefix="/finance", tags=["Finance"])
 app.include_router(depreciation_schedule.router, prefix="/finance", tags=["Finance"])
 app.include_router(impairment_revaluation.router, prefix="/finance", tags=["Finance"])
+app.include_router(depreciation_jobs.router, prefix="/finance", tags=["Finance"])
+app.include_router(depreciation_posting.router, prefix="/finance", tags=["Finance"])
+app.include_router(net_book_value.router, prefix="/finance", tags=["Finance"])
 
 @app.get("/{full_path:path}")
 async def serve_react_app(full_path: str):
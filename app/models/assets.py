@@ -1,7 +1,8 @@
 from tortoise.models import Model
 from tortoise import fields
-import random
+from tortoise.expressions import Q, Subquery
 from datetime import date
+from app.services.id_allocator import id_allocator
 
 
 # ✅ Asset Categories
@@ -19,6 +20,25 @@ class AssetStatus(str):
     IN_TRANSIT = "in_transit"
     DISPOSED = "disposed"
 
+# Legacy rows carry the "Disposed" status written by the disposal route
+DISPOSED_STATUSES = [AssetStatus.DISPOSED, "Disposed"]
+
+
+def held_on(as_of: date) -> Q:
+    """
+    Asset filter: still held on `as_of`, i.e. no disposal dated on or before
+    it. The current status only matters for assets marked disposed without
+    a disposal record (e.g. imported), which have no date and stay out.
+    """
+    disposed_by = AssetDisposal.filter(disposal_date__lte=as_of).values("asset_id")
+    recorded = AssetDisposal.all().values("asset_id")
+    return ~Q(id__in=Subquery(disposed_by)) & ~Q(Q(status__in=DISPOSED_STATUSES) & ~Q(id__in=Subquery(recorded)))
+
+# ✅ Depreciation Method Choices
+class DepreciationMethod(str):
+    STRAIGHT_LINE = "straight_line"
+    DECLINING_BALANCE = "declining_balance"
+
 # ✅ Asset Model
 class Asset(Model):
     id = fields.IntField(pk=True)
@@ -32,15 +52,26 @@ class Asset(Model):
     purchase_price = fields.DecimalField(max_digits=12, decimal_places=2)
     purchase_date = fields.DateField()
     status = fields.CharField(max_length=20, default=AssetStatus.IN_SERVICE)
+    depreciation_method = fields.CharField(max_length=30, default=DepreciationMethod.STRAIGHT_LINE)
+    updated_at = fields.DatetimeField(auto_now=True, null=True)
+
+    class Meta:
+        indexes = (
+            ("company_id", "id"),
+            ("company_id", "status"),
+            ("company_id", "category"),
+            ("company_id", "location_id"),
+            ("company_id", "purchase_date"),
+        )
     
     async def generate_asset_id(self):
-        """Generate a unique asset ID (e.g., AST-1001)."""
-        while True:
-            random_number = random.randint(1000, 9999)
-            asset_id = f"AST-{random_number}"
-            exists = await Asset.filter(asset_id=asset_id).exists()
-            if not exists:
-                return asset_id
+        """Generate a unique asset ID (e.g., AST-00010001)."""
+        return await id_allocator.next_id("asset")
+
+    @classmethod
+    async def generate_asset_ids(cls, count: int):
+        """Generate `count` unique asset IDs from one reserved block."""
+        return await id_allocator.next_ids("asset", count)
 
     async def save(self, *args, **kwargs):
         """Auto-generate asset_id on first save."""
@@ -61,13 +92,8 @@ class Vendor(Model):
     status = fields.CharField(max_length=20, default="active")
 
     async def generate_vendor_id(self):
-        """Generate a unique vendor ID (e.g., VEN-1001)."""
-        while True:
-            random_number = random.randint(1000, 9999)
-            vendor_id = f"VEN-{random_number}"
-            exists = await Vendor.filter(vendor_id=vendor_id).exists()
-            if not exists:
-                return vendor_id
+        """Generate a unique vendor ID (e.g., VEN-00010001)."""
+        return await id_allocator.next_id("vendor")
 
     async def save(self, *args, **kwargs):
         """Auto-generate vendor_id on first save."""
@@ -88,17 +114,20 @@ class Maintenance(Model):
     vendor = fields.ForeignKeyField("models.Vendor", related_name="maintenances", null=True, on_delete=fields.SET_NULL)
     status = fields.CharField(max_length=20, default="scheduled")
 
+    class Meta:
+        indexes = (("asset_id", "scheduled_date"), ("status", "scheduled_date"), ("company_id", "scheduled_date"))
+
     async def generate_task_id(self):
-        """Generate a unique maintenance task ID (e.g., MAIN-1001)."""
-        while True:
-            random_number = random.randint(1000, 9999)
-            task_id = f"MAIN-{random_number}"
-            exists = await Maintenance.filter(task_id=task_id).exists()
-            if not exists:
-                return task_id
+        """Generate a unique maintenance task ID (e.g., MAIN-0010001)."""
+        return await id_allocator.next_id("maintenance")
 
     async def save(self, *args, **kwargs):
-        """Auto-generate task_id and update status based on scheduled date."""
+        """
+        Auto-generate task_id and update status based on scheduled date.
+
+        Only covers the row being saved; MaintenanceScheduler moves every
+        other due task out of `scheduled` periodically.
+        """
         if not self.task_id:
             self.task_id = await self.generate_task_id()
 
@@ -127,6 +156,9 @@ class AssetTransfer(Model):
     transfer_date = fields.DateField()
     note = fields.TextField(max_length=400)
 
+    class Meta:
+        indexes = (("asset_id", "transfer_date"), ("company_id", "transfer_date"))
+
 # ✅ AssetDisposal Model
 class AssetDisposal(Model):
     id = fields.IntField(pk=True)
@@ -137,3 +169,6 @@ class AssetDisposal(Model):
     value_received = fields.DecimalField(max_digits=10, decimal_places=2)
     note = fields.TextField(null=True)
     approved_by = fields.CharField(max_length=100)
+
+    class Meta:
+        indexes = (("asset_id", "disposal_date"), ("company_id", "disposal_date"))
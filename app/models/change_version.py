@@ -0,0 +1,16 @@
+from tortoise.models import Model
+from tortoise import fields
+
+# ✅ Change Version Model
+class ChangeVersion(Model):
+    id = fields.IntField(pk=True)
+    resource = fields.CharField(max_length=30)  # e.g. "asset", "location"
+    company_id = fields.IntField()  # no FK: the version must outlive a deleted company's rows
+    version = fields.BigIntField(default=0)
+    modified_at = fields.DatetimeField()
+
+    class Meta:
+        unique_together = (("resource", "company_id"),)
+
+    def __str__(self):
+        return f"{self.resource} {self.company_id} v{self.version}"
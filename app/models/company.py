@@ -24,6 +24,7 @@ class Location(Model):
     country = fields.CharField(max_length=100)
     city = fields.CharField(max_length=100)
     address = fields.TextField()
+    updated_at = fields.DatetimeField(auto_now=True, null=True)
 
     def __str__(self):
         return f"{self.name} - {self.company.name}"
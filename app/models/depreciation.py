@@ -8,6 +8,8 @@ class Depreciation(Model):
     residual_value = fields.IntField()
     useful_life_ifrs = fields.IntField()
     useful_life_tax = fields.IntField()
+    version = fields.IntField(default=1)
+    updated_at = fields.DatetimeField(auto_now=True, null=True)
     
     def __str__(self):
         return self.name
\ No newline at end of file
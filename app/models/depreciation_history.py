@@ -6,9 +6,32 @@ from datetime import date
 # ✅ Depreciation Model
 class DepreciationHistory(Model):    
     id = fields.IntField(pk=True)
-    asset_id = fields.ForeignKeyField("models.Asset", related_name="history", on_delete=fields.CASCADE)
+    asset = fields.ForeignKeyField("models.Asset", related_name="history", on_delete=fields.CASCADE)
+    category = fields.CharField(max_length=50)
+    policy_version = fields.IntField()
+    fingerprint = fields.CharField(max_length=40)
     depreciation = fields.JSONField()
     update_date = fields.DateField()
+
+    class Meta:
+        unique_together = (("asset", "category", "policy_version"),)
     
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return f"{self.asset_id} - {self.category} v{self.policy_version}"
+
+# ✅ Depreciation Posting Model
+class DepreciationPosting(Model):
+    id = fields.IntField(pk=True)
+    asset = fields.ForeignKeyField("models.Asset", related_name="postings", on_delete=fields.CASCADE)
+    company = fields.ForeignKeyField("models.Company", related_name="depreciation_postings", on_delete=fields.CASCADE)
+    period = fields.DateField()
+    amount_ifrs = fields.DecimalField(max_digits=12, decimal_places=2)
+    amount_tax = fields.DecimalField(max_digits=12, decimal_places=2)
+    posted_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = (("asset", "period"),)
+        indexes = (("company_id", "period"),)
+
+    def __str__(self):
+        return f"{self.asset_id} - {self.period}"
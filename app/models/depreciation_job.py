@@ -0,0 +1,30 @@
+from tortoise.models import Model
+from tortoise import fields
+
+# ✅ Job Status Choices
+class JobStatus(str):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+# ✅ Depreciation Job Model
+class DepreciationJob(Model):
+    id = fields.UUIDField(pk=True)
+    company = fields.ForeignKeyField("models.Company", related_name="depreciation_jobs", on_delete=fields.CASCADE)
+    status = fields.CharField(max_length=20, default=JobStatus.QUEUED)
+    total = fields.IntField(default=0)
+    processed = fields.IntField(default=0)
+    skipped = fields.IntField(default=0)
+    error = fields.TextField(null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    started_at = fields.DatetimeField(null=True)
+    finished_at = fields.DatetimeField(null=True)
+    owner = fields.CharField(max_length=32, null=True)  # token of the runner process holding the lease
+    heartbeat_at = fields.DatetimeField(null=True)
+
+    class Meta:
+        indexes = (("status", "created_at"),)
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
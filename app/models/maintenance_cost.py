@@ -0,0 +1,19 @@
+from tortoise.models import Model
+from tortoise import fields
+
+# ✅ Maintenance Cost Rollup Model
+class MaintenanceCostRollup(Model):
+    id = fields.IntField(pk=True)
+    company = fields.ForeignKeyField("models.Company", related_name="maintenance_cost_rollups", on_delete=fields.CASCADE)
+    asset = fields.ForeignKeyField("models.Asset", related_name="maintenance_cost_rollups", on_delete=fields.CASCADE)
+    vendor_id = fields.IntField(default=0)  # 0 = no vendor, so the unique key never holds NULL
+    month = fields.DateField()  # first day of the month
+    total_cost = fields.DecimalField(max_digits=14, decimal_places=2, default=0)
+    task_count = fields.IntField(default=0)
+
+    class Meta:
+        unique_together = (("company", "asset", "vendor_id", "month"),)
+        indexes = (("company_id", "month"), ("company_id", "vendor_id"))
+
+    def __str__(self):
+        return f"{self.asset_id} - {self.vendor_id} - {self.month}"
@@ -0,0 +1,10 @@
+from tortoise.models import Model
+from tortoise import fields
+
+# ✅ ID Sequence Model
+class IdSequence(Model):
+    name = fields.CharField(max_length=50, pk=True)
+    next_value = fields.BigIntField()
+
+    def __str__(self):
+        return f"{self.name} ({self.next_value})"
@@ -0,0 +1,26 @@
+from decimal import Decimal
+import orjson
+from fastapi.responses import JSONResponse
+
+def _default(value):
+    """Encode what orjson does not handle natively the way FastAPI's jsonable_encoder would."""
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class ORJSONResponse(JSONResponse):
+    """
+    Default response class of the app: orjson encoding (dates, UUIDs and numpy
+    arrays natively, Decimals as numbers).
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+def rows_response(rows, headers: dict = None, status_code: int = 200):
+    """
+    Return rows read with `.values()` (or other trusted, already shaped data)
+    as-is: FastAPI skips `response_model` validation and `jsonable_encoder`
+    for Response objects, so the rows go straight to orjson.
+    """
+    return ORJSONResponse(content=rows, headers=headers, status_code=status_code)
@@ -1,37 +1,196 @@
-from fastapi import APIRouter, Depends, HTTPException
-from app.models.assets import Asset, AssetTransfer, AssetDisposal, Maintenance, Vendor
-from app.schemas.assets import AssetSchema, AssetTransferSchema, AssetDisposalSchema, MaintenanceSchema, VendorSchema
+from datetime import date, timedelta
+from decimal import Decimal
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.functions import Sum
+from tortoise.transactions import in_transaction
+from app.models.assets import Asset, AssetTransfer, AssetDisposal, Maintenance, Vendor, DepreciationMethod, DISPOSED_STATUSES
+from app.schemas.assets import AssetSchema, AssetTransferSchema, AssetDisposalSchema, MaintenanceSchema, VendorSchema, BulkAssetTransferSchema
 from app.models.company import Company, Location
+from app.models.maintenance_cost import MaintenanceCostRollup
+from app.responses import rows_response
+from app.services.asset_import import import_assets
+from app.services.asset_search import search_assets
+from app.services.asset_stats import asset_stats_cache
+from app.services.asset_timeline import asset_timeline, decode_cursor
+from app.services import change_tracker
+from app.services.export import export_columnar, export_csv
+from app.services.id_allocator import id_allocator
+from app.services.maintenance_rollup import record_created, record_updated, rollup_key
+from app.services.schedule_cache import schedule_cache
 router = APIRouter()
 
+# Response key -> Asset column, for `.values()` projections
+ASSET_FIELDS = {
+    "id": "id",
+    "asset_id": "asset_id",
+    "company": "company_id",
+    "location": "location_id",
+    "name": "name",
+    "category": "category",
+    "department": "department",
+    "assigned": "assigned",
+    "purchase_price": "purchase_price",
+    "purchase_date": "purchase_date",
+    "status": "status",
+    "depreciation_method": "depreciation_method",
+}
+
+VENDOR_FIELDS = {
+    "company": "company_id",
+    "name": "name",
+    "email": "email",
+    "phone": "phone",
+    "address": "address",
+    "service_categories": "service_categories",
+    "status": "status",
+}
+
+MAINTENANCE_FIELDS = {
+    "asset": "asset_id",
+    "company": "company_id",
+    "maintenance_type": "maintenance_type",
+    "description": "description",
+    "scheduled_date": "scheduled_date",
+    "cost": "cost",
+    "vendor": "vendor_id",
+    "status": "status",
+}
+
+# group_by -> MaintenanceCostRollup column
+COST_GROUPS = {"asset": "asset_id", "vendor": "vendor_id", "month": "month"}
+
+CALENDAR_MAX_DAYS = 92
+CALENDAR_FIELDS = {
+    "id": "id",
+    "task_id": "task_id",
+    "asset": "asset_id",
+    "asset_name": "asset__name",
+    **{key: column for key, column in MAINTENANCE_FIELDS.items() if key not in ("asset", "company")},
+}
+
 # ✅ List & Create Assets
-@router.get("/", response_model=list[AssetSchema])
-async def list_assets():
+@router.get("/")
+async def list_assets(
+    request: Request,
+    company_id: int = Query(..., description="tenant whose assets to list"),
+    status: str = None,
+    category: str = None,
+    location_id: int = None,
+    department: str = None,
+    purchased_from: date = None,
+    purchased_to: date = None,
+    after: int = Query(None, description="cursor: id of the last asset of the previous page (X-Next-Cursor)"),
+    limit: int = Query(100, ge=1, le=1000),
+    fields: str = Query(None, description="comma separated fields to return (e.g. id,name,status)"),
+):
     """
-    Get All Assets List
+    Get a company's Assets List, ordered by id and paginated by cursor
+
+    `company_id` is required, so every page is read through the
+    (company_id, id) index. The response carries an `X-Next-Cursor` header
+    while more assets are available; pass it back as `after` to get the next
+    page. Send the `ETag` back as `If-None-Match` to get `304 Not Modified`
+    while nothing changed.
 
-    URL : http://localhost:8000/api/assets/
+    URL : http://localhost:8000/api/assets/?company_id=1&status=in_service&fields=id,asset_id,name&limit=100
 
     """ 
-    assets = await Asset.all()
+    headers, fresh = await change_tracker.check(request, "asset", company_id)
+    if fresh:
+        return Response(status_code=304, headers=headers)
 
-    result = []
-    for asset in assets:
-        result.append({
-            "id": asset.id,
-            "asset_id": asset.asset_id,
-            "company": asset.company_id, 
-            "location": asset.location_id,  
-            "name": asset.name,
-            "category": asset.category,
-            "department": asset.department,
-            "assigned": asset.assigned,
-            "purchase_price": asset.purchase_price,
-            "purchase_date": asset.purchase_date,
-            "status": asset.status
-        })
-    
-    return result
+    selected = [name.strip() for name in fields.split(",") if name.strip()] if fields else list(ASSET_FIELDS)
+    unknown = [name for name in selected if name not in ASSET_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    query = Asset.filter(company_id=company_id)
+    if status:
+        query = query.filter(status=status)
+    if category:
+        query = query.filter(category=category)
+    if location_id is not None:
+        query = query.filter(location_id=location_id)
+    if department:
+        query = query.filter(department=department)
+    if purchased_from:
+        query = query.filter(purchase_date__gte=purchased_from)
+    if purchased_to:
+        query = query.filter(purchase_date__lte=purchased_to)
+    if after is not None:
+        query = query.filter(id__gt=after)
+
+    projection = {name: ASSET_FIELDS[name] for name in ["id", *selected]}
+    rows = await query.order_by("id").limit(limit).values(**projection)
+    if len(rows) == limit:
+        headers["X-Next-Cursor"] = str(rows[-1]["id"])
+    if "id" not in selected:
+        for row in rows:
+            del row["id"]
+    return rows_response(rows, headers=headers)
+
+# ✅ Search Assets
+@router.get("/search")
+async def search_assets_list(
+    company_id: int,
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """
+    Search a company's assets by asset ID, name, assignee or department,
+    best match first
+
+    The response carries an `X-Next-Offset` header while more results are
+    available; pass it back as `offset` to get the next page.
+
+    URL : http://localhost:8000/api/assets/search?company_id=1&q=lapt&limit=20
+
+    """
+    rows = await search_assets(company_id, q, limit, offset)
+    headers = {"X-Next-Offset": str(offset + limit)} if len(rows) == limit else None
+    return rows_response(rows, headers=headers)
+
+# ✅ Dashboard Statistics
+@router.get("/stats")
+async def asset_stats(company_id: int):
+    """
+    Asset count and purchase value of a company by category, status, location
+    and department, plus totals
+
+    URL : http://localhost:8000/api/assets/stats?company_id=1
+
+    """
+    return await asset_stats_cache.get(company_id)
+
+# ✅ Export Asset Register
+@router.get("/export/{dataset}")
+async def export_dataset(
+    dataset: str = Path(..., pattern="^(assets|transfers|disposals|maintenance)$"),
+    format: str = Query("csv", pattern="^(csv|columnar)$"),
+    company_id: int = None,
+    date_from: date = None,
+    date_to: date = None,
+):
+    """
+    Stream a full export of assets, transfers, disposals or maintenance as CSV
+    or columnar NDJSON. `date_from`/`date_to` filter on the purchase, transfer,
+    disposal or scheduled date.
+
+    URL : http://localhost:8000/api/assets/export/transfers?company_id=1&date_from=2025-01-01&format=csv
+
+    """
+    filters = {"company_id": company_id, "date_from": date_from, "date_to": date_to}
+    if format == "columnar":
+        return StreamingResponse(export_columnar(dataset, **filters), media_type="application/x-ndjson")
+    return StreamingResponse(
+        export_csv(dataset, **filters),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.csv"'},
+    )
 
 @router.post("/", response_model=AssetSchema)
 async def create_asset(asset_data: AssetSchema):
@@ -48,7 +207,8 @@ async def create_asset(asset_data: AssetSchema):
         "department": "Finance",
         "assigned": "Jone Doe",
         "purchase_price": 1200.00,
-        "purchase_date": "2025-04-15"
+        "purchase_date": "2025-04-15",
+        "depreciation_method": "straight_line"
     }
 
     URL: http://16.171.11.180/api/assets/
@@ -56,16 +216,21 @@ async def create_asset(asset_data: AssetSchema):
     # Get the related Company instance
     company = await Company.get(id=asset_data.company)
     location = await Location.get(id=asset_data.location)
-    asset = await Asset.create(
-        company=company,
-        name=asset_data.name,
-        location=location,
-        category=asset_data.category,
-        department = asset_data.department,
-        assigned= asset_data.assigned,
-        purchase_price=asset_data.purchase_price,
-        purchase_date=asset_data.purchase_date,
-    )
+    async with in_transaction() as conn:
+        asset = await Asset.create(
+            company=company,
+            name=asset_data.name,
+            location=location,
+            category=asset_data.category,
+            department = asset_data.department,
+            assigned= asset_data.assigned,
+            purchase_price=asset_data.purchase_price,
+            purchase_date=asset_data.purchase_date,
+            depreciation_method=asset_data.depreciation_method or DepreciationMethod.STRAIGHT_LINE,
+            using_db=conn,
+        )
+        await change_tracker.bump("asset", asset.company_id, using_db=conn)
+    asset_stats_cache.invalidate(asset.company_id)
     
     return {
         "id": asset.id,
@@ -78,12 +243,36 @@ async def create_asset(asset_data: AssetSchema):
         "assigned": asset.assigned,
         "purchase_price": asset.purchase_price,
         "purchase_date": asset.purchase_date,
-        "status": asset.status
+        "status": asset.status,
+        "depreciation_method": asset.depreciation_method
     }
 
+# ✅ Bulk Import Assets
+@router.post("/import")
+async def import_assets_file(request: Request, format: str = Query(None, pattern="^(csv|ndjson)$")):
+    """
+    Bulk import assets from a CSV or NDJSON request body (streamed, not multipart).
+    The format comes from `format` or the Content-Type (text/csv, application/x-ndjson).
+
+    CSV Sample:
+
+    company,location,name,category,department,assigned,purchase_price,purchase_date
+    1,1,Dell 18 Laptop,it_equipment,Finance,Jone Doe,1200.00,2025-04-15
+
+    URL: http://localhost:8000/api/assets/import?format=csv
+
+    Response: {"imported": 1, "failed": 0, "errors": [{"row": 3, "errors": [...]}]}
+    """
+    if format is None:
+        format = "ndjson" if "json" in request.headers.get("content-type", "") else "csv"
+    report = await import_assets(request.stream(), format)
+    if report["imported"]:
+        asset_stats_cache.clear()
+    return report
+
 # ✅ Retrieve Asset by ID
 @router.get("/{asset_id}", response_model=AssetSchema)
-async def get_asset(asset_id: str):
+async def get_asset(asset_id: str, request: Request):
     """
     Get Asset by Asset_id
 
@@ -92,23 +281,40 @@ async def get_asset(asset_id: str):
     URL : http://16.171.11.180/api/assets/AST-8871
 
     """ 
-    asset = await Asset.get_or_none(asset_id=asset_id)
-    print("Response data:", asset)
+    asset = await Asset.filter(asset_id=asset_id).first().values(**ASSET_FIELDS, updated_at="updated_at")
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return {
-        "id": asset.id,
-        "asset_id": asset.asset_id,
-        "company": asset.company_id,
-        "location": asset.location_id,
-        "name": asset.name,
-        "category": asset.category,
-        "department": asset.department,
-        "assigned": asset.assigned,
-        "purchase_price": asset.purchase_price,
-        "purchase_date": asset.purchase_date,
-        "status": asset.status
-    }
+    headers, fresh = change_tracker.check_stamps(request, [asset.pop("updated_at")])
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    return rows_response(asset, headers=headers)
+
+# ✅ Asset Timeline
+@router.get("/{asset_id}/timeline")
+async def get_asset_timeline(
+    asset_id: int,
+    after: str = Query(None, description="cursor of the previous page (X-Next-Cursor)"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    Transfers, maintenance, depreciation postings and disposal of an asset,
+    newest first, paginated by cursor
+
+    The response carries an `X-Next-Cursor` header while more events are
+    available; pass it back as `after` to get the next page.
+
+    URL : http://localhost:8000/api/assets/3/timeline?limit=50
+
+    """
+    try:
+        cursor = decode_cursor(after) if after else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not await Asset.exists(id=asset_id):
+        raise HTTPException(status_code=404, detail="Asset not found")
+
+    events, next_cursor = await asset_timeline(asset_id, limit, cursor)
+    return rows_response(events, headers={"X-Next-Cursor": next_cursor} if next_cursor else None)
 
 # ✅ Create Transfer
 @router.post("/transfer", response_model=AssetTransferSchema)
@@ -131,60 +337,55 @@ async def transfer_asset(data: AssetTransferSchema):
     URL: http://16.171.11.180/api/assets/transfer
 
     """ 
-    asset = await Asset.get(id=data.asset)
-    
-    if asset.status == "Disposed":
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "message": "Cannot transfer of this asset",
-                "reason": "Asset is already disposed"
-            }
-        )
-    
-    from_location_id = asset.location_id
-    from_department = asset.department
-    from_assigned = asset.assigned
-    
-    company_id = asset.company_id
-    company = None
-    if company_id:
-        company = await Company.get(id=company_id)
-
-    from_location = None
-    if from_location_id:
-        from_location = await Location.get(id=from_location_id)
-    
-    to_location = await Location.get(id=data.to_location)
+    async with in_transaction() as conn:
+        # Row lock: a concurrent disposal or transfer of this asset waits for us
+        asset = await Asset.filter(id=data.asset).select_for_update().using_db(conn).first()
+        if not asset:
+            raise HTTPException(status_code=404, detail="Asset not found")
+        if asset.status in DISPOSED_STATUSES:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": "Cannot transfer of this asset",
+                    "reason": "Asset is already disposed"
+                }
+            )
 
-    asset.location = to_location
-    asset.assigned = data.to_assigned
-    asset.department = data.to_department
-    asset.status = "pending"
-    
-    await asset.save()
-    
-    transfer = await AssetTransfer.create(
-        asset=asset,
-        company=company,
-        from_location=from_location,
-        from_department=from_department,
-        from_assigned=from_assigned,
-        to_location=to_location,
-        to_department=data.to_department,
-        to_assigned=data.to_assigned,
-        transferred_by=data.transferred_by,
-        transfer_date=data.transfer_date,
-        note=data.note or ""
-    )
+        try:
+            await Asset.filter(id=asset.id).using_db(conn).update(
+                location_id=data.to_location,
+                assigned=data.to_assigned,
+                department=data.to_department,
+                status="pending",
+                updated_at=timezone.now(),
+            )
+            await AssetTransfer.create(
+                asset_id=asset.id,
+                company_id=asset.company_id,
+                from_location_id=asset.location_id,
+                from_department=asset.department,
+                from_assigned=asset.assigned,
+                to_location_id=data.to_location,
+                to_department=data.to_department,
+                to_assigned=data.to_assigned,
+                transferred_by=data.transferred_by,
+                transfer_date=data.transfer_date,
+                note=data.note or "",
+                using_db=conn,
+            )
+        except IntegrityError:
+            raise HTTPException(status_code=404, detail="Location not found")
+        await change_tracker.bump("asset", asset.company_id, using_db=conn)
+    schedule_cache.invalidate_asset(asset.id)
+    asset_stats_cache.invalidate(asset.company_id)
     
     return {
         "asset": asset.id,
-        "company":company_id,
-        "from_location": from_location_id,  
-        "from_department": from_department,
-        "from_assigned": from_assigned,
-        "to_location": to_location.id,  
+        "company": asset.company_id,
+        "from_location": asset.location_id,  
+        "from_department": asset.department,
+        "from_assigned": asset.assigned,
+        "to_location": data.to_location,  
         "to_department": data.to_department,
         "to_assigned": data.to_assigned,
         "transferred_by": data.transferred_by,
@@ -192,6 +393,103 @@ async def transfer_asset(data: AssetTransferSchema):
         "note": data.note or ""
     }
 
+# ✅ Bulk Transfer
+@router.post("/transfer/bulk", response_model=dict)
+async def bulk_transfer_assets(data: BulkAssetTransferSchema):
+    """
+    Transfer many assets in one transaction. Each item may override the
+    shared destination (to_location, to_department, to_assigned).
+
+    Request Body
+
+    {
+    "assets": [{"asset": 3}, {"asset": 4}, {"asset": 5, "to_assigned": "Kevin"}],
+    "to_department": "Finance",
+    "to_assigned": "Jone Doe",
+    "to_location": 3,
+    "transferred_by": "Kevin",
+    "transfer_date": "2025-04-16",
+    "note": "office move"
+    }
+
+    URL: http://16.171.11.180/api/assets/transfer/bulk
+
+    """
+    destinations = {}
+    for item in data.assets:
+        destination = (
+            item.to_location or data.to_location,
+            item.to_department or data.to_department,
+            item.to_assigned or data.to_assigned,
+        )
+        if not all(destination):
+            raise HTTPException(status_code=400, detail=f"Missing destination for asset {item.asset}")
+        destinations[item.asset] = destination
+
+    location_ids = {destination[0] for destination in destinations.values()}
+    found_locations = set(await Location.filter(id__in=list(location_ids)).values_list("id", flat=True))
+    if location_ids - found_locations:
+        raise HTTPException(status_code=404, detail=f"Location not found: {sorted(location_ids - found_locations)}")
+
+    async with in_transaction() as conn:
+        assets = await Asset.filter(id__in=list(destinations)).select_for_update().using_db(conn)
+        missing = set(destinations) - {asset.id for asset in assets}
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Asset not found: {sorted(missing)}")
+        disposed = [asset.id for asset in assets if asset.status in DISPOSED_STATUSES]
+        if disposed:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": "Cannot transfer of these assets",
+                    "reason": "Assets are already disposed",
+                    "assets": sorted(disposed)
+                }
+            )
+
+        groups = {}
+        for asset_id, destination in destinations.items():
+            groups.setdefault(destination, []).append(asset_id)
+        for (to_location, to_department, to_assigned), asset_ids in groups.items():
+            await Asset.filter(id__in=asset_ids).using_db(conn).update(
+                location_id=to_location,
+                department=to_department,
+                assigned=to_assigned,
+                status="pending",
+                updated_at=timezone.now(),
+            )
+
+        await AssetTransfer.bulk_create(
+            [
+                AssetTransfer(
+                    asset_id=asset.id,
+                    company_id=asset.company_id,
+                    from_location_id=asset.location_id,
+                    from_department=asset.department,
+                    from_assigned=asset.assigned,
+                    to_location_id=destinations[asset.id][0],
+                    to_department=destinations[asset.id][1],
+                    to_assigned=destinations[asset.id][2],
+                    transferred_by=data.transferred_by,
+                    transfer_date=data.transfer_date,
+                    note=data.note or ""
+                )
+                for asset in assets
+            ],
+            using_db=conn,
+        )
+        await change_tracker.bump("asset", *{asset.company_id for asset in assets}, using_db=conn)
+
+    for asset in assets:
+        schedule_cache.invalidate_asset(asset.id)
+    asset_stats_cache.invalidate(*{asset.company_id for asset in assets})
+
+    return {
+        "transferred": len(assets),
+        "assets": sorted(destinations),
+        "message": "Assets transferred successfully"
+    }
+
 # ✅ Create Dispost
 @router.post("/disposal", response_model=dict)
 async def dispose_asset(data: AssetDisposalSchema):
@@ -212,45 +510,45 @@ async def dispose_asset(data: AssetDisposalSchema):
     URL : http://16.171.11.180/api/assets/disposal
     
     """
-    asset = await Asset.get(id=data.asset)
-
-    if asset.status == "Disposed":
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "message": "Cannot dispose of this asset",
-                "reason": "Asset is already disposed"
-            }
-        )
-    
-    company_id = asset.company_id
-    company = None
-    if company_id:
-        company = await Company.get(id=company_id)
-
-    await AssetDisposal.create(
-        asset=asset,
-        company=company,
-        method=data.method,
-        disposal_date=data.disposal_date,
-        value_received=data.value_received,
-        note=data.note,
-        approved_by=data.approved_by
-    )
+    async with in_transaction() as conn:
+        # Row lock: a concurrent transfer or second disposal waits and then sees "Disposed"
+        asset = await Asset.filter(id=data.asset).select_for_update().using_db(conn).first()
+        if not asset:
+            raise HTTPException(status_code=404, detail="Asset not found")
+        if asset.status in DISPOSED_STATUSES:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "message": "Cannot dispose of this asset",
+                    "reason": "Asset is already disposed"
+                }
+            )
 
-    asset.status = "Disposed"
-    await asset.save()
+        await Asset.filter(id=asset.id).using_db(conn).update(status="Disposed", updated_at=timezone.now())
+        await AssetDisposal.create(
+            asset_id=asset.id,
+            company_id=asset.company_id,
+            method=data.method,
+            disposal_date=data.disposal_date,
+            value_received=data.value_received,
+            note=data.note,
+            approved_by=data.approved_by,
+            using_db=conn,
+        )
+        await change_tracker.bump("asset", asset.company_id, using_db=conn)
+    schedule_cache.invalidate_asset(asset.id)
+    asset_stats_cache.invalidate(asset.company_id)
 
     return {
         "asset": asset.id,
-        "status": asset.status,
+        "status": "Disposed",
         "message": "Asset disposed successfully"
     }
 
 # ✅ List & Create Vendors
 @router.get("/vendors", response_model=list[VendorSchema])
 async def list_vendors():
-    return await Vendor.all()
+    return rows_response(await Vendor.all().values(**VENDOR_FIELDS))
 
 @router.post("/vendors", response_model=VendorSchema)
 async def create_vendor(vendor_data: VendorSchema):
@@ -260,9 +558,156 @@ async def create_vendor(vendor_data: VendorSchema):
 # ✅ List & Create Maintenance Records
 @router.get("/maintenance", response_model=list[MaintenanceSchema])
 async def list_maintenance():
-    return await Maintenance.all()
+    return rows_response(await Maintenance.all().values(**MAINTENANCE_FIELDS))
+
+# ✅ Maintenance Calendar
+@router.get("/maintenance/calendar")
+async def maintenance_calendar(
+    company_id: int,
+    start: date,
+    end: date,
+    status: str = None,
+    vendor_id: int = None,
+    asset_id: int = None,
+):
+    """
+    Maintenance tasks of a company scheduled between `start` and `end`
+    (inclusive, at most 92 days), grouped by day
+
+    URL : http://localhost:8000/api/assets/maintenance/calendar?company_id=1&start=2025-04-01&end=2025-04-30&status=scheduled
+
+    Response: {"start": "2025-04-01", "end": "2025-04-30", "days": {"2025-04-03": [{...}, ...]}}
+    """
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    if end - start >= timedelta(days=CALENDAR_MAX_DAYS):
+        raise HTTPException(status_code=400, detail=f"The window is limited to {CALENDAR_MAX_DAYS} days")
+
+    query = Maintenance.filter(company_id=company_id, scheduled_date__gte=start, scheduled_date__lte=end)
+    if status:
+        query = query.filter(status=status)
+    if vendor_id is not None:
+        query = query.filter(vendor_id=vendor_id)
+    if asset_id is not None:
+        query = query.filter(asset_id=asset_id)
+
+    days = {}
+    for event in await query.order_by("scheduled_date", "id").values(**CALENDAR_FIELDS):
+        days.setdefault(event["scheduled_date"], []).append(event)
+    return rows_response({"start": start, "end": end, "days": days})
+
+# ✅ Maintenance Cost Report
+@router.get("/maintenance/costs")
+async def maintenance_costs(
+    company_id: int,
+    group_by: str = Query("asset", pattern="^(asset|vendor|month)$"),
+    start: date = None,
+    end: date = None,
+    asset_id: int = None,
+    vendor_id: int = None,
+):
+    """
+    Total maintenance cost and task count of a company per asset, vendor or
+    month, read from the maintenance cost rollups. Per asset the cost is also
+    given as a share of the purchase price (total cost of ownership).
+
+    `start` and `end` select whole months: any day selects its month, so
+    start=2025-01-20 includes all of January.
+
+    URL : http://localhost:8000/api/assets/maintenance/costs?company_id=1&group_by=vendor&start=2025-01-01&end=2025-12-31
+
+    """
+    query = MaintenanceCostRollup.filter(company_id=company_id)
+    if start:
+        query = query.filter(month__gte=start.replace(day=1))
+    if end:
+        query = query.filter(month__lte=end)
+    if asset_id is not None:
+        query = query.filter(asset_id=asset_id)
+    if vendor_id is not None:
+        query = query.filter(vendor_id=vendor_id)
+
+    column = COST_GROUPS[group_by]
+    rows = await (
+        query.annotate(cost=Sum("total_cost"), tasks=Sum("task_count"))
+        .group_by(column).order_by(column)
+        .values(column, "cost", "tasks")
+    )
+    groups = [
+        {group_by: row[column], "total_cost": row["cost"], "task_count": row["tasks"]}
+        for row in rows if row["tasks"]
+    ]
+    if group_by == "vendor":
+        for group in groups:
+            group["vendor"] = group["vendor"] or None  # rollups store "no vendor" as 0
+    if group_by == "asset":
+        prices = dict(await Asset.filter(id__in=[group["asset"] for group in groups]).values_list("id", "purchase_price"))
+        for group in groups:
+            price = prices.get(group["asset"])
+            group["purchase_price"] = price
+            group["cost_share"] = round(float(group["total_cost"]) / float(price), 4) if price else None
+    return rows_response(groups)
+
+def maintenance_response(maintenance: Maintenance):
+    return {
+        "asset": maintenance.asset_id,
+        "company": maintenance.company_id,
+        "maintenance_type": maintenance.maintenance_type,
+        "description": maintenance.description,
+        "scheduled_date": maintenance.scheduled_date,
+        "cost": maintenance.cost,
+        "vendor": maintenance.vendor_id,
+        "status": maintenance.status,
+    }
+
+def maintenance_write_error(exc: IntegrityError) -> HTTPException:
+    # Only a missing asset, company or vendor is a 404; a duplicate task_id is a conflict
+    if "foreign key" in str(exc).lower():
+        return HTTPException(status_code=404, detail="Asset, company or vendor not found")
+    return HTTPException(status_code=409, detail="Maintenance task conflicts with an existing one")
 
 @router.post("/maintenance", response_model=MaintenanceSchema)
 async def create_maintenance(maintenance_data: MaintenanceSchema):
-    maintenance = await Maintenance.create(**maintenance_data.dict())
-    return maintenance
+    # Reserved outside the transaction, so a failed insert cannot roll the reservation back
+    task_id = await id_allocator.next_id("maintenance")
+    try:
+        async with in_transaction() as conn:
+            maintenance = await Maintenance.create(
+                task_id=task_id,
+                asset_id=maintenance_data.asset,
+                company_id=maintenance_data.company,
+                maintenance_type=maintenance_data.maintenance_type,
+                description=maintenance_data.description,
+                scheduled_date=maintenance_data.scheduled_date,
+                cost=Decimal(str(maintenance_data.cost)),
+                vendor_id=maintenance_data.vendor,
+                status=maintenance_data.status,
+                using_db=conn,
+            )
+            await record_created(conn, maintenance)
+    except IntegrityError as exc:
+        raise maintenance_write_error(exc)
+    return maintenance_response(maintenance)
+
+@router.put("/maintenance/{maintenance_id}", response_model=MaintenanceSchema)
+async def update_maintenance(maintenance_id: int, maintenance_data: MaintenanceSchema):
+    try:
+        async with in_transaction() as conn:
+            maintenance = await Maintenance.filter(id=maintenance_id).select_for_update().using_db(conn).first()
+            if not maintenance:
+                raise HTTPException(status_code=404, detail="Maintenance not found")
+            before, before_cost = rollup_key(maintenance), Decimal(str(maintenance.cost))
+
+            maintenance.asset_id = maintenance_data.asset
+            maintenance.company_id = maintenance_data.company
+            maintenance.maintenance_type = maintenance_data.maintenance_type
+            maintenance.description = maintenance_data.description
+            maintenance.scheduled_date = maintenance_data.scheduled_date
+            maintenance.cost = Decimal(str(maintenance_data.cost))
+            maintenance.vendor_id = maintenance_data.vendor
+            maintenance.status = maintenance_data.status
+            await maintenance.save(using_db=conn)
+            await record_updated(conn, before, before_cost, maintenance)
+    except IntegrityError as exc:
+        raise maintenance_write_error(exc)
+    return maintenance_response(maintenance)
@@ -1,14 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from tortoise.transactions import in_transaction
 from app.models.company import Company, Location, Department, Invitation
 from app.schemas.company import CompanySchema, LocationSchema, DepartmentSchema, InvitationSchema
 from app.database import init_db
+from app.responses import rows_response
+from app.services import change_tracker
 
 router = APIRouter()
 
+# Response key -> model column, for `.values()` list reads
+COMPANY_FIELDS = ["name", "legal_name", "tax_id", "email", "phone", "website", "address"]
+LOCATION_FIELDS = {
+    "company": "company_id",
+    "name": "name",
+    "code": "code",
+    "location_type": "location_type",
+    "country": "country",
+    "city": "city",
+    "address": "address",
+}
+DEPARTMENT_FIELDS = {"company": "company_id", "name": "name", "description": "description", "manager": "manager_id"}
+INVITATION_FIELDS = {
+    "invitation_id": "invitation_id",
+    "company": "company_id",
+    "name": "name",
+    "email": "email",
+    "role": "role",
+    "department": "department_id",
+    "status": "status",
+}
+
 # 🚀 List & Create Companies
 @router.get("/", response_model=list[CompanySchema])
 async def list_companies():
-    return await Company.all()
+    return rows_response(await Company.all().values(*COMPANY_FIELDS))
 
 @router.post("/", response_model=CompanySchema)
 async def create_company(company_data: CompanySchema):
@@ -36,21 +61,27 @@ async def delete_company(company_id: int):
     company = await Company.get_or_none(id=company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
-    await company.delete()
+    async with in_transaction() as conn:
+        await company.delete(using_db=conn)
+        await change_tracker.bump("asset", company_id, using_db=conn)
+        await change_tracker.bump("location", company_id, using_db=conn)
     return {"message": "Company deleted successfully"}
 
 @router.post("/location", response_model=LocationSchema)
 async def create_location(location_data: LocationSchema):
     company = await Company.get(id=location_data.company)
-    location = await Location.create(
-        company=company,
-        name=location_data.name,
-        code= location_data.code,
-        location_type=location_data.location_type,
-        country=location_data.country,
-        city=location_data.city,
-        address=location_data.address
-    )
+    async with in_transaction() as conn:
+        location = await Location.create(
+            company=company,
+            name=location_data.name,
+            code= location_data.code,
+            location_type=location_data.location_type,
+            country=location_data.country,
+            city=location_data.city,
+            address=location_data.address,
+            using_db=conn,
+        )
+        await change_tracker.bump("location", company.id, using_db=conn)
     return {
         "company":company.id,
         "name":location_data.name,
@@ -63,15 +94,18 @@ async def create_location(location_data: LocationSchema):
 
 # 🚀 List Locations by Company
 @router.get("/{company_id}/locations", response_model=list[LocationSchema])
-async def list_locations(company_id: int):
-    return await Location.filter(company_id=company_id)
+async def list_locations(company_id: int, request: Request):
+    headers, fresh = await change_tracker.check(request, "location", company_id)
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    return rows_response(await Location.filter(company_id=company_id).values(**LOCATION_FIELDS), headers=headers)
 
 # 🚀 List Departments by Company
 @router.get("/{company_id}/departments", response_model=list[DepartmentSchema])
 async def list_departments(company_id: int):
-    return await Department.filter(company_id=company_id)
+    return rows_response(await Department.filter(company_id=company_id).values(**DEPARTMENT_FIELDS))
 
 # 🚀 List Invitations by Company
 @router.get("/{company_id}/invitations", response_model=list[InvitationSchema])
 async def list_invitations(company_id: int):
-    return await Invitation.filter(company_id=company_id)
+    return rows_response(await Invitation.filter(company_id=company_id).values(**INVITATION_FIELDS))
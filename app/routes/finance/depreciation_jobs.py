@@ -0,0 +1,73 @@
+from uuid import UUID
+from fastapi import APIRouter, HTTPException, Query
+from app.models.assets import Asset
+from app.models.company import Company
+from app.models.depreciation_job import DepreciationJob, JobStatus
+from app.schemas.depreciation_job import DepreciationJobSchema
+from app.services.depreciation_jobs import depreciation_jobs
+from app.services.policy_cache import policy_cache
+from app.services.schedule_store import get_schedules
+
+router = APIRouter(prefix='/depreciation-jobs')
+
+def job_response(job: DepreciationJob):
+    return {
+        "id": job.id,
+        "company": job.company_id,
+        "status": job.status,
+        "total": job.total,
+        "processed": job.processed,
+        "skipped": job.skipped,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+# 🚀 Submit a Depreciation Run
+@router.post("/", response_model=DepreciationJobSchema, status_code=202)
+async def submit_depreciation_job(data: DepreciationJobSchema):
+    """
+    Queue a depreciation run over every asset of a company.
+
+    Request Body:
+
+    {
+        "company": 1
+    }
+
+    URL: http://localhost:8000/finance/depreciation-jobs/
+    """
+    if not await Company.filter(id=data.company).exists():
+        raise HTTPException(status_code=404, detail="Company not found")
+    job = await depreciation_jobs.submit(data.company)
+    return job_response(job)
+
+# 🚀 Depreciation Run Progress
+@router.get("/{job_id}", response_model=DepreciationJobSchema)
+async def get_depreciation_job(job_id: UUID):
+    job = await DepreciationJob.get_or_none(id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_response(job)
+
+# 🚀 Depreciation Run Results
+@router.get("/{job_id}/results")
+async def get_depreciation_job_results(
+    job_id: UUID,
+    after: int = Query(0, description="id of the last asset of the previous page"),
+    limit: int = Query(500, ge=1, le=5000),
+):
+    job = await DepreciationJob.get_or_none(id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+
+    assets = await Asset.filter(company_id=job.company_id, id__gt=after).order_by("id").limit(limit)
+    policies = await policy_cache.get_all()
+    covered = [asset for asset in assets if asset.category in policies]
+    return {
+        "items": await get_schedules(covered, policies),
+        "next_cursor": assets[-1].id if len(assets) == limit else None,
+    }
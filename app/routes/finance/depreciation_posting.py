@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException
+from app.models.company import Company
+from app.schemas.depreciation_history import DepreciationPostingSchema
+from app.services.depreciation_posting import post_period
+
+router = APIRouter(prefix='/depreciation-posting')
+
+# 🚀 Post a Depreciation Period
+@router.post("/", response_model=DepreciationPostingSchema)
+async def post_depreciation_period(data: DepreciationPostingSchema):
+    """
+    Post the monthly depreciation of every asset of a company for one period.
+    Assets already posted for the period are skipped.
+
+    Request Body:
+
+    {
+        "company": 1,
+        "period": "2025-03-01"
+    }
+
+    URL: http://localhost:8000/finance/depreciation-posting/
+    """
+    if not await Company.filter(id=data.company).exists():
+        raise HTTPException(status_code=404, detail="Company not found")
+    return await post_period(data.company, data.period)
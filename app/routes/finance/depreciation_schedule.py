@@ -1,138 +1,97 @@
-from fastapi import APIRouter, HTTPException
-from app.models.depreciation import Depreciation
-from app.models.depreciation_history import DepreciationHistory
+import json
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from app.models.assets import Asset
-from app.database import init_db
-import datetime
+from app.responses import rows_response
+from app.services.policy_cache import policy_cache
+from app.services.schedule_cache import schedule_cache
+from app.services.schedule_format import FORMAT_PATTERN, SINGLE_FORMAT_PATTERN, compact_response, negotiate_format
+from app.services.schedule_store import get_schedules
 router = APIRouter(prefix='/depreciation-schedule')
 
+STREAM_CHUNK_SIZE = 500
+
+async def stream_schedules(company_id: int = None, chunk_size: int = STREAM_CHUNK_SIZE):
+    """
+    NDJSON lines of depreciation schedules, one asset per line, in asset id
+    order (assets without a policy get an error line in their place).
+
+    Assets are paged by primary key (keyset) so only one chunk of assets and
+    schedules is held in memory at a time.
+    """
+    policies = await policy_cache.get_all()
+    last_id = 0
+    while True:
+        query = Asset.filter(id__gt=last_id)
+        if company_id is not None:
+            query = query.filter(company_id=company_id)
+        assets = await query.order_by("id").limit(chunk_size)
+        if not assets:
+            break
+        last_id = assets[-1].id
+
+        covered = [asset for asset in assets if asset.category in policies]
+        schedules = iter(await get_schedules(covered, policies))
+        # One line per asset in id order, so consumers can resume after the last id they saw
+        lines = [
+            json.dumps(
+                next(schedules) if asset.category in policies
+                else {"asset_id": asset.id, "error": "Depreciation not found"}
+            )
+            for asset in assets
+        ]
+        yield "\n".join(lines) + "\n"
+
 # 🚀 All Assets Annually and Monthly Depreciation
 @router.get("/")
-async def list_depreciations_schedule():
-    data = []    
-    depreciation_data = []    
-    currentDate = datetime.datetime.now()
-    assets = await Asset.all()
-    for asset in assets:
-        annual_depreciation_ifrs = []
-        monthly_depreciation_ifrs = []
-        annual_depreciation_tax = []
-        monthly_depreciation_tax = []
-        depreciation = await Depreciation.get_or_none(category=asset.category)     
-        if not depreciation:
-            raise HTTPException(status_code=404, detail="Depreciation not found")
-        
-        purchase_price = asset.purchase_price        
-        residual_value = depreciation.residual_value
-        useful_life_ifrs = int(depreciation.useful_life_ifrs)
-        depreciation_rate_ifrs = 2 / useful_life_ifrs
-        useful_life_tax = int(depreciation.useful_life_tax)
-        depreciation_rate_tax = 2 / useful_life_tax
-        if asset.depreciation_method == "straight_line":
-            annual_depreciation_ifrs_value = (purchase_price - residual_value) / useful_life_ifrs
-            for i in range(useful_life_ifrs):
-                annual_depreciation_ifrs.append({f"{i+1}_year": round(annual_depreciation_ifrs_value, 2)})
-                monthly_depreciation_ifrs.append({f"{i+1}_month": round(annual_depreciation_ifrs_value / 12, 2)})
-            annual_depreciation_tax_value = (purchase_price - residual_value) / useful_life_tax
-            for i in range(useful_life_tax):
-                annual_depreciation_tax.append({f"{i+1}_year": round(annual_depreciation_tax_value, 2)})
-                monthly_depreciation_tax.append({f"{i+1}_month": round(annual_depreciation_tax_value / 12, 2)})
+async def list_depreciations_schedule(
+    format: str = Query(None, pattern=FORMAT_PATTERN, description="json (default), ndjson to stream one asset per line, columnar or binary"),
+    company_id: int = None,
+    accept: str = Header(None),
+):
+    format = negotiate_format(format, accept)
+    if format == "ndjson":
+        return StreamingResponse(stream_schedules(company_id), media_type="application/x-ndjson")
 
-        else :
-            for i in range(useful_life_ifrs):
-                annual_depreciation_ifrs_value = purchase_price * depreciation_rate_ifrs / useful_life_ifrs
-                purchase_price = purchase_price - annual_depreciation_ifrs_value
-                annual_depreciation_ifrs.append({f"{i}year": round(annual_depreciation_ifrs_value, 2)})
-                monthly_depreciation_ifrs.append({f"{i}month": round(annual_depreciation_ifrs_value / 12, 2)})
-            for i in range(useful_life_tax):
-                annual_depreciation_tax_value = purchase_price * depreciation_rate_tax / useful_life_tax
-                purchase_price = purchase_price - annual_depreciation_tax_value
-                annual_depreciation_tax.append({f"{i}year": round(annual_depreciation_tax_value, 2)})
-                monthly_depreciation_tax.append({f"{i}month": round(annual_depreciation_tax_value / 12, 2)})
+    query = Asset.all()
+    if company_id is not None:
+        query = query.filter(company_id=company_id)
+    assets = await query
+    policies = await policy_cache.get_all()
+    if any(asset.category not in policies for asset in assets):
+        raise HTTPException(status_code=404, detail="Depreciation not found")
 
-        data.append({
-            "asset_name": asset.name,
-            "asset_category": asset.category,
-            "depreciation_method": asset.depreciation_method,
-            "depreciation_ifrs": {
-                "annual_depreciation_ifrs": annual_depreciation_ifrs,
-                "monthly_depreciation_ifrs": monthly_depreciation_ifrs
-            },
-            "depreciation_tax": {
-                "annual_depreciation_tax": annual_depreciation_tax,
-                "monthly_depreciation_tax": monthly_depreciation_tax
-            }  
-        })
-        depreciation_data.append({
-            "asset_id": asset.id,
-            "update_date": asset.purchase_date,
-            "update_date": currentDate
-        })
-    await DepreciationHistory.create(depreciation_data)
-    
-    return data
+    if format in ("columnar", "binary"):
+        return compact_response(format, assets, policies)
+    return rows_response(await get_schedules(assets, policies))
+
+# 🚀 Schedule Cache Statistics
+@router.get("/cache-stats")
+async def depreciation_schedule_cache_stats():
+    return schedule_cache.stats()
 
 # 🚀 Asset Annually and Monthly Depreciation
 @router.get("/{asset_id}")
-async def depreciation_schedule(asset_id: int):
+async def depreciation_schedule(
+    asset_id: int,
+    format: str = Query(None, pattern=SINGLE_FORMAT_PATTERN, description="json (default), columnar or binary"),
+    accept: str = Header(None),
+):
+    format = negotiate_format(format, accept)
+    if format not in ("columnar", "binary"):
+        schedule = await schedule_cache.get(asset_id)
+        if schedule is not None:
+            return [schedule]
+
     asset = await Asset.get_or_none(id=asset_id)
-    data=[]
-    depreciation_data = []    
-    annual_depreciation_ifrs = []
-    monthly_depreciation_ifrs = []
-    annual_depreciation_tax = []
-    monthly_depreciation_tax = []
-    currentDate = datetime.datetime.now()
-    depreciation = await Depreciation.get_or_none(category=asset.category)     
-    if not depreciation:
+    if not asset:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    policies = await policy_cache.get_all()
+    if asset.category not in policies:
         raise HTTPException(status_code=404, detail="Depreciation not found")
-    
-    purchase_price = asset.purchase_price
-    residual_value = depreciation.residual_value
-    useful_life_ifrs = int(depreciation.useful_life_ifrs)    
-    depreciation_rate_ifrs = 2 / useful_life_ifrs
-    useful_life_tax = int(depreciation.useful_life_tax)
-    depreciation_rate_tax = 2 / useful_life_tax
-    if asset.depreciation_method == "straight_line":
-        annual_depreciation_ifrs_value = (purchase_price - residual_value) / useful_life_ifrs
-        for i in range(useful_life_ifrs):
-            annual_depreciation_ifrs.append({"annual": round(annual_depreciation_ifrs_value, 2)})
-            monthly_depreciation_ifrs.append({"monthly": round(annual_depreciation_ifrs_value / 12, 2)})
-        annual_depreciation_tax_value = (purchase_price - residual_value) / useful_life_tax
-        for i in range(useful_life_tax):
-            annual_depreciation_tax.append({f"{i+1}_year": round(annual_depreciation_tax_value, 2)})
-            monthly_depreciation_tax.append({f"{i+1}_month": round(annual_depreciation_tax_value / 12, 2)})
-
-    else :
-        for i in range(useful_life_ifrs):
-            annual_depreciation_ifrs_value = purchase_price * depreciation_rate_ifrs / useful_life_ifrs
-            purchase_price = purchase_price - annual_depreciation_ifrs_value
-            annual_depreciation_ifrs.append({"annual": round(annual_depreciation_ifrs_value, 2)})
-            monthly_depreciation_ifrs.append({"monthly": round(annual_depreciation_ifrs_value / 12, 2)})
-        for i in range(useful_life_tax):
-            annual_depreciation_tax_value = purchase_price * depreciation_rate_tax / useful_life_tax
-            purchase_price = purchase_price - annual_depreciation_tax_value
-            annual_depreciation_tax.append({f"{i}year": round(annual_depreciation_tax_value, 2)})
-            monthly_depreciation_tax.append({f"{i}month": round(annual_depreciation_tax_value / 12, 2)})
-
-    data.append({
-        "asset_name": asset.name,
-        "asset_category": asset.category,
-        "depreciation_method": asset.depreciation_method,
-        "depreciation_ifrs": {
-            "annual_depreciation_ifrs": annual_depreciation_ifrs,
-            "monthly_depreciation_ifrs": monthly_depreciation_ifrs
-        },
-        "depreciation_tax": {
-            "annual_depreciation_tax": annual_depreciation_tax,
-            "monthly_depreciation_tax": monthly_depreciation_tax
-        }      
-    })      
-    depreciation_data.append({
-        "asset_id": asset.id,
-        "update_date": asset.purchase_date,
-        "update_date": currentDate
-    })
-    history = await DepreciationHistory.get_or_none(id=asset.id)
-    return history
 
+    if format in ("columnar", "binary"):
+        return compact_response(format, [asset], policies)
+    schedules = await get_schedules([asset], policies)
+    schedule_cache.set(asset, policies[asset.category], schedules[0])
+    return schedules
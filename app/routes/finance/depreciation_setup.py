@@ -1,41 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from app.models.depreciation import Depreciation
+from app.responses import rows_response
 from app.schemas.depreciation import DepreciationSchema
-from app.database import init_db
+from app.services import change_tracker
+from app.services.policy_cache import policy_cache
+from app.services.schedule_cache import schedule_cache
 
 router = APIRouter(prefix='/depreciation-setup')
 
 # 🚀 List & Create Companies
 @router.get("/", response_model=list[DepreciationSchema])
-async def list_depreciations():
-    return await Depreciation.all()
+async def list_depreciations(request: Request):
+    policies = list((await policy_cache.get_all()).values())
+    headers, fresh = change_tracker.check_stamps(request, [policy.updated_at for policy in policies])
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    rows = [{field: getattr(policy, field) for field in DepreciationSchema.model_fields} for policy in policies]
+    return rows_response(rows, headers=headers)
 
 @router.post("/", response_model=DepreciationSchema)
 async def create_depreciation(depreciation_data: DepreciationSchema):
     depreciation = await Depreciation.create(**depreciation_data.dict())
+    policy_cache.invalidate()
     return depreciation
 
 # 🚀 Get, Update & Delete a Depreciation
 @router.get("/{depreciation_id}", response_model=DepreciationSchema)
-async def get_depreciation(depreciation_id: int):
-    depreciation = await Depreciation.get_or_none(id=depreciation_id)
+async def get_depreciation(depreciation_id: str):
+    depreciation = await policy_cache.get(depreciation_id)
     if not depreciation:
         raise HTTPException(status_code=404, detail="Depreciation not found")
     return depreciation
 
 @router.put("/{depreciation_id}", response_model=DepreciationSchema)
-async def update_depreciation(depreciation_id: int, depreciation_data: DepreciationSchema):
-    depreciation = await Depreciation.get_or_none(id=depreciation_id)
+async def update_depreciation(depreciation_id: str, depreciation_data: DepreciationSchema):
+    depreciation = await Depreciation.get_or_none(category=depreciation_id)
     if not depreciation:
         raise HTTPException(status_code=404, detail="Depreciation not found")
-    await depreciation.update_from_dict(depreciation_data.dict()).save()
+    depreciation.update_from_dict(depreciation_data.dict())
+    depreciation.version += 1
+    await depreciation.save()
+    policy_cache.invalidate()
+    schedule_cache.invalidate_category(depreciation_id)
     return depreciation
 
 @router.delete("/{depreciation_id}")
-async def delete_depreciation(depreciation_id: int):
-    depreciation = await Depreciation.get_or_none(id=depreciation_id)
+async def delete_depreciation(depreciation_id: str):
+    depreciation = await Depreciation.get_or_none(category=depreciation_id)
     if not depreciation:
         raise HTTPException(status_code=404, detail="Depreciation not found")
     await depreciation.delete()
+    policy_cache.invalidate()
+    schedule_cache.invalidate_category(depreciation_id)
     return {"message": "Depreciation deleted successfully"}
-
@@ -1,65 +1,102 @@
-from fastapi import APIRouter, HTTPException
-from app.models.depreciation import Depreciation
+from fastapi import APIRouter, Header, HTTPException, Query
+from tortoise.expressions import Q
 from app.models.assets import Asset
-from app.database import init_db
+from app.schemas.depreciation import ImpairmentBatchSchema
+from app.services.depreciation_engine import build_schedules, columnar_book, compute_schedules
+from app.services.policy_cache import policy_cache
+from app.services.schedule_format import SINGLE_FORMAT_PATTERN, compact_response, negotiate_format
 
 router = APIRouter(prefix='/impairment-revaluation')
 
 # 🚀 Impairment and Depreciation of Asset
 @router.post("/")
-async def impairment_revaluation(data: dict):
+async def impairment_revaluation(
+    data: dict,
+    format: str = Query(None, pattern=SINGLE_FORMAT_PATTERN, description="json (default), columnar or binary"),
+    accept: str = Header(None),
+):
     asset_id = data.get("asset_id")
     fair_value = data.get("fair_value")
+    if fair_value is None:
+        raise HTTPException(status_code=400, detail="fair_value is required")
     asset = await Asset.get_or_none(id=asset_id)    
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
-    data=[]
-    annual_depreciation_ifrs = []
-    monthly_depreciation_ifrs = []
-    annual_depreciation_tax = []
-    monthly_depreciation_tax = []
-    depreciation = await Depreciation.get_or_none(category=asset.category)     
-    if not depreciation:
+    policies = await policy_cache.get_all()
+    if asset.category not in policies:
         raise HTTPException(status_code=404, detail="Depreciation not found")
-    
-    residual_value = depreciation.residual_value
-    useful_life_ifrs = int(depreciation.useful_life_ifrs)    
-    depreciation_rate_ifrs = 2 / useful_life_ifrs
-    useful_life_tax = int(depreciation.useful_life_tax)
-    depreciation_rate_tax = 2 / useful_life_tax
-    if asset.depreciation_method == "straight_line":
-        annual_depreciation_ifrs_value = (fair_value - residual_value) / useful_life_ifrs
-        for i in range(useful_life_ifrs):
-            annual_depreciation_ifrs.append({"annual": round(annual_depreciation_ifrs_value, 2)})
-            monthly_depreciation_ifrs.append({"monthly": round(annual_depreciation_ifrs_value / 12, 2)})
-        annual_depreciation_tax_value = (fair_value - residual_value) / useful_life_tax
-        for i in range(useful_life_tax):
-            annual_depreciation_tax.append({f"{i+1}_year": round(annual_depreciation_tax_value, 2)})
-            monthly_depreciation_tax.append({f"{i+1}_month": round(annual_depreciation_tax_value / 12, 2)})
 
-    else :
-        for i in range(useful_life_ifrs):
-            annual_depreciation_ifrs_value = fair_value * depreciation_rate_ifrs / useful_life_ifrs
-            fair_value = fair_value - annual_depreciation_ifrs_value
-            annual_depreciation_ifrs.append({"annual": round(annual_depreciation_ifrs_value, 2)})
-            monthly_depreciation_ifrs.append({"monthly": round(annual_depreciation_ifrs_value / 12, 2)})
-        for i in range(useful_life_tax):
-            annual_depreciation_tax_value = fair_value * depreciation_rate_tax / useful_life_tax
-            fair_value = fair_value - annual_depreciation_tax_value
-            annual_depreciation_tax.append({f"{i}year": round(annual_depreciation_tax_value, 2)})
-            monthly_depreciation_tax.append({f"{i}month": round(annual_depreciation_tax_value / 12, 2)})
+    format = negotiate_format(format, accept)
+    if format in ("columnar", "binary"):
+        return compact_response(format, [asset], policies, prices=[fair_value])
+    return build_schedules([asset], policies, prices=[fair_value])
 
-    data.append({
-        "asset_name": asset.name,
-        "asset_category": asset.category,
-        "depreciation_method": asset.depreciation_method,
-        "depreciation_ifrs": {
-            "annual_depreciation_ifrs": annual_depreciation_ifrs,
-            "monthly_depreciation_ifrs": monthly_depreciation_ifrs
-        },
-        "depreciation_tax": {
-            "annual_depreciation_tax": annual_depreciation_tax,
-            "monthly_depreciation_tax": monthly_depreciation_tax
-        }      
-    })
-    return data
+# 🚀 Batch What-if Impairment and Revaluation
+@router.post("/batch")
+async def impairment_revaluation_batch(data: ImpairmentBatchSchema):
+    """
+    Revised schedules for many scenarios in one call, returned as parallel
+    arrays (one element per scenario; see `columnar_book` for the books).
+
+    Request Body:
+
+    {
+        "items": [
+            {"asset_id": 3, "fair_value": 900},
+            {"asset_id": 3, "fair_value": 700}
+        ],
+        "category_shocks": {"vehicle": -20},
+        "company_id": 1
+    }
+
+    `category_shocks` revalues every asset of a category (within
+    `company_id` when given) by a percentage of its purchase price.
+
+    URL: http://localhost:8000/finance/impairment-revaluation/batch
+    """
+    query = Q(id__in=list({item.asset_id for item in data.items}))
+    if data.category_shocks:
+        shocked = Q(category__in=list(data.category_shocks))
+        if data.company_id is not None:
+            shocked = Q(shocked, company_id=data.company_id)
+        query = Q(query, shocked, join_type="OR")
+    assets = {asset.id: asset for asset in await Asset.filter(query)}
+    policies = await policy_cache.get_all()
+
+    scenarios = []
+    errors = []
+    for item in data.items:
+        asset = assets.get(item.asset_id)
+        if not asset:
+            errors.append({"asset_id": item.asset_id, "detail": "Asset not found"})
+        else:
+            scenarios.append((asset, "fair_value", item.fair_value))
+    for asset in assets.values():
+        shock = data.category_shocks.get(asset.category)
+        if shock is not None and (data.company_id is None or asset.company_id == data.company_id):
+            scenarios.append((asset, f"shock:{asset.category}", float(asset.purchase_price) * (1 + shock / 100)))
+
+    scenarios = [scenario for scenario in scenarios if scenario[0].category in policies]
+    errors.extend(
+        {"asset_id": asset.id, "detail": "Depreciation not found"}
+        for asset in assets.values() if asset.category not in policies
+    )
+
+    ifrs_life = [policies[asset.category].useful_life_ifrs for asset, _, _ in scenarios]
+    tax_life = [policies[asset.category].useful_life_tax for asset, _, _ in scenarios]
+    ifrs, tax = compute_schedules(
+        [fair_value for _, _, fair_value in scenarios],
+        [policies[asset.category].residual_value for asset, _, _ in scenarios],
+        ifrs_life,
+        tax_life,
+        [asset.depreciation_method for asset, _, _ in scenarios],
+    )
+    return {
+        "asset_id": [asset.id for asset, _, _ in scenarios],
+        "scenario": [scenario for _, scenario, _ in scenarios],
+        "fair_value": [round(fair_value, 2) for _, _, fair_value in scenarios],
+        "depreciation_method": [asset.depreciation_method for asset, _, _ in scenarios],
+        "depreciation_ifrs": columnar_book(ifrs, ifrs_life),
+        "depreciation_tax": columnar_book(tax, tax_life),
+        "errors": errors,
+    }
@@ -0,0 +1,110 @@
+from datetime import date
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query
+from app.models.assets import Asset, held_on
+from app.services.depreciation_engine import months_booked, net_book_value
+from app.services.policy_cache import policy_cache
+
+router = APIRouter(prefix='/net-book-value')
+
+GROUP_FIELDS = {"company": "company_id", "category": "category", "location": "location_id"}
+VALUE_FIELDS = ["id", "category", "purchase_price", "purchase_date", "depreciation_method", "company_id", "location_id"]
+
+def nbv_arrays(assets, policies, as_of: date):
+    """Closed-form accumulated depreciation and NBV on both books for `.values()` rows."""
+    months = months_booked(
+        [asset["purchase_date"].toordinal() for asset in assets],
+        [asset["purchase_date"].year for asset in assets],
+        [asset["purchase_date"].month for asset in assets],
+        as_of,
+    )
+    return net_book_value(
+        [asset["purchase_price"] for asset in assets],
+        [policies[asset["category"]].residual_value for asset in assets],
+        [policies[asset["category"]].useful_life_ifrs for asset in assets],
+        [policies[asset["category"]].useful_life_tax for asset in assets],
+        [asset["depreciation_method"] for asset in assets],
+        months,
+    )
+
+# 🚀 Portfolio Net Book Value
+@router.get("/")
+async def portfolio_net_book_value(
+    company_id: int = None,
+    as_of: date = None,
+    group_by: str = Query("category", description="comma separated: company, category, location"),
+):
+    """
+    Net book value of all assets held on `as_of` (default today),
+    aggregated by any combination of company, category and location.
+    Assets disposed after `as_of` are included, as they were on that date.
+
+    URL: http://localhost:8000/finance/net-book-value/?company_id=1&as_of=2025-12-31&group_by=category,location
+    """
+    as_of = as_of or date.today()
+    keys = [key.strip() for key in group_by.split(",") if key.strip()]
+    if not keys or any(key not in GROUP_FIELDS for key in keys):
+        raise HTTPException(status_code=400, detail=f"group_by must be a combination of {', '.join(GROUP_FIELDS)}")
+
+    query = Asset.filter(held_on(as_of), purchase_date__lte=as_of)
+    if company_id is not None:
+        query = query.filter(company_id=company_id)
+    rows = await query.values(*VALUE_FIELDS)
+    policies = await policy_cache.get_all()
+    assets = [asset for asset in rows if asset["category"] in policies]
+
+    groups = {}
+    index = np.fromiter(
+        (groups.setdefault(tuple(asset[GROUP_FIELDS[key]] for key in keys), len(groups)) for asset in assets),
+        dtype=np.int64,
+        count=len(assets),
+    )
+    price = np.asarray([asset["purchase_price"] for asset in assets], dtype=np.float64)
+    accumulated_ifrs, nbv_ifrs, accumulated_tax, nbv_tax = nbv_arrays(assets, policies, as_of)
+
+    def totals(values):
+        return np.round(np.bincount(index, weights=values, minlength=len(groups)), 2).tolist()
+
+    counts = np.bincount(index, minlength=len(groups)).tolist()
+    sums = [totals(values) for values in (price, accumulated_ifrs, nbv_ifrs, accumulated_tax, nbv_tax)]
+    return {
+        "as_of": as_of,
+        "skipped": len(rows) - len(assets),
+        "groups": [
+            {
+                **dict(zip(keys, group)),
+                "asset_count": counts[i],
+                "purchase_price": sums[0][i],
+                "accumulated_ifrs": sums[1][i],
+                "nbv_ifrs": sums[2][i],
+                "accumulated_tax": sums[3][i],
+                "nbv_tax": sums[4][i],
+            }
+            for group, i in groups.items()
+        ],
+    }
+
+# 🚀 Asset Net Book Value
+@router.get("/{asset_id}")
+async def asset_net_book_value(asset_id: int, as_of: date = None):
+    as_of = as_of or date.today()
+    asset = await Asset.filter(held_on(as_of), id=asset_id).first().values(*VALUE_FIELDS)
+    if not asset:
+        if await Asset.exists(id=asset_id):
+            raise HTTPException(status_code=404, detail=f"Asset was disposed on or before {as_of}")
+        raise HTTPException(status_code=404, detail="Asset not found")
+    policies = await policy_cache.get_all()
+    if asset["category"] not in policies:
+        raise HTTPException(status_code=404, detail="Depreciation not found")
+
+    accumulated_ifrs, nbv_ifrs, accumulated_tax, nbv_tax = nbv_arrays([asset], policies, as_of)
+    return {
+        "asset_id": asset["id"],
+        "as_of": as_of,
+        "purchase_price": asset["purchase_price"],
+        "depreciation_method": asset["depreciation_method"],
+        "accumulated_ifrs": round(float(accumulated_ifrs[0]), 2),
+        "nbv_ifrs": round(float(nbv_ifrs[0]), 2),
+        "accumulated_tax": round(float(accumulated_tax[0]), 2),
+        "nbv_tax": round(float(nbv_tax[0]), 2),
+    }
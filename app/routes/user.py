@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from app.models.user import User, Permission
 from app.schemas.user import UserSchema, PermissionSchema
 from app.database import init_db
+from app.responses import rows_response
 
 router = APIRouter()
 
@@ -23,4 +24,4 @@ async def get_user(user_id: int):
 
 @router.get("/permissions", response_model=list[PermissionSchema])
 async def list_permissions():
-    return await Permission.all()
+    return rows_response(await Permission.all().values("name", "codename"))
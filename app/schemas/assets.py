@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 
 class AssetSchema(BaseModel):
@@ -14,6 +14,7 @@ class AssetSchema(BaseModel):
     purchase_price: float = Field(..., description="asset purchase_price (e.g 1200)")
     purchase_date: date = Field(..., description="date when asset purchased (e.g 2025-03-12)")
     status: Optional[str] = Field(None, description="asset status (e.g in service, pending, disposed)")
+    depreciation_method: Optional[str] = Field("straight_line", description="depreciation method (e.g straight_line, declining_balance)")
 
     class Config:
         from_attributes = True
@@ -62,6 +63,23 @@ class AssetTransferSchema(BaseModel):
         from_attributes = True
 
 
+class BulkTransferItemSchema(BaseModel):
+    asset: int
+    to_location: Optional[int] = None
+    to_department: Optional[str] = None
+    to_assigned: Optional[str] = None
+
+
+class BulkAssetTransferSchema(BaseModel):
+    assets: List[BulkTransferItemSchema]
+    to_location: Optional[int] = None
+    to_department: Optional[str] = None
+    to_assigned: Optional[str] = None
+    transferred_by: str
+    transfer_date: date
+    note: Optional[str] = None
+
+
 class AssetDisposalSchema(BaseModel):
     asset: int
     company: Optional[int] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Dict, List, Optional
 
 class DepreciationSchema(BaseModel):
     category: str
@@ -8,4 +8,13 @@ class DepreciationSchema(BaseModel):
     useful_life_tax: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ImpairmentItemSchema(BaseModel):
+    asset_id: int
+    fair_value: float
+
+class ImpairmentBatchSchema(BaseModel):
+    items: List[ImpairmentItemSchema] = []
+    category_shocks: Dict[str, float] = {}
+    company_id: Optional[int] = None
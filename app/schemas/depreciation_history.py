@@ -4,8 +4,19 @@ from datetime import date
 
 class DepreciationHistorySchema(BaseModel):
     asset_id: int
-    depreciation: str
+    category: str
+    policy_version: int
+    depreciation: dict
     update_date: date
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class DepreciationPostingSchema(BaseModel):
+    company: int
+    period: date
+    posted: int = 0
+    already_posted: int = 0
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+
+class DepreciationJobSchema(BaseModel):
+    id: Optional[UUID] = None
+    company: int
+    status: Optional[str] = None
+    total: int = 0
+    processed: int = 0
+    skipped: int = 0
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
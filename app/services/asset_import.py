@@ -0,0 +1,136 @@
+import codecs
+import csv
+import json
+from pydantic import ValidationError
+from tortoise.exceptions import BaseORMException
+from tortoise.transactions import in_transaction
+from app.models.assets import Asset, AssetStatus, DepreciationMethod
+from app.models.company import Company, Location
+from app.schemas.assets import AssetSchema
+from app.services import change_tracker
+
+CHUNK_SIZE = 1000
+
+
+async def _lines(body):
+    """Decoded text lines of a streamed request body."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in body:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield pending.rstrip("\r")
+
+
+async def _csv_rows(body):
+    header = None
+    record = ""
+    async for line in _lines(body):
+        record = f"{record}\n{line}" if record else line
+        # A quoted field may span lines: wait for its closing quote
+        if record.count('"') % 2:
+            continue
+        if record.strip():
+            values = next(csv.reader([record]))
+            if header is None:
+                header = [name.strip() for name in values]
+            else:
+                yield dict(zip(header, values))
+        record = ""
+
+
+async def _ndjson_rows(body):
+    async for line in _lines(body):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield exc
+
+
+async def _import_chunk(chunk, report):
+    valid = []
+    for row_number, row in chunk:
+        try:
+            if isinstance(row, Exception):
+                raise row
+            valid.append((row_number, AssetSchema(**{key: value for key, value in row.items() if value != ""})))
+        except (ValidationError, ValueError, TypeError) as exc:
+            if isinstance(exc, ValidationError):
+                errors = exc.errors(include_url=False, include_context=False, include_input=False)
+            else:
+                errors = [str(exc)]
+            report["errors"].append({"row": row_number, "errors": errors})
+    if not valid:
+        return
+
+    companies = set(await Company.filter(id__in=list({data.company for _, data in valid})).values_list("id", flat=True))
+    locations = dict(await Location.filter(id__in=list({data.location for _, data in valid})).values_list("id", "company_id"))
+    accepted = []
+    for row_number, data in valid:
+        if data.company not in companies:
+            report["errors"].append({"row": row_number, "errors": ["Company not found"]})
+        elif locations.get(data.location) != data.company:
+            report["errors"].append({"row": row_number, "errors": ["Location not found for this company"]})
+        else:
+            accepted.append((row_number, data))
+    if not accepted:
+        return
+
+    asset_ids = await Asset.generate_asset_ids(len(accepted))
+    assets = [
+        Asset(
+            asset_id=asset_id,
+            company_id=data.company,
+            location_id=data.location,
+            name=data.name,
+            category=data.category,
+            department=data.department,
+            assigned=data.assigned,
+            purchase_price=data.purchase_price,
+            purchase_date=data.purchase_date,
+            status=data.status or AssetStatus.IN_SERVICE,
+            depreciation_method=data.depreciation_method or DepreciationMethod.STRAIGHT_LINE,
+        )
+        for asset_id, (_, data) in zip(asset_ids, accepted)
+    ]
+    try:
+        async with in_transaction() as conn:
+            await Asset.bulk_create(assets, batch_size=CHUNK_SIZE, using_db=conn)
+            await change_tracker.bump("asset", *{asset.company_id for asset in assets}, using_db=conn)
+    except BaseORMException as exc:
+        report["errors"].extend({"row": row_number, "errors": [str(exc)]} for row_number, _ in accepted)
+        return
+    report["imported"] += len(assets)
+
+
+async def import_assets(body, format: str) -> dict:
+    """
+    Import assets from a streamed CSV (header row first) or NDJSON body.
+
+    Rows are validated against AssetSchema and written CHUNK_SIZE at a time:
+    one company and one location lookup per chunk, asset IDs allocated for
+    the whole chunk and one `bulk_create` per chunk inside a transaction.
+    Invalid rows are reported by row number (1 = first data row) and skipped.
+    """
+    rows = _ndjson_rows(body) if format == "ndjson" else _csv_rows(body)
+    report = {"imported": 0, "errors": []}
+    chunk = []
+    row_number = 0
+    async for row in rows:
+        row_number += 1
+        if not isinstance(row, (dict, Exception)):
+            row = ValueError("Row is not an object")
+        chunk.append((row_number, row))
+        if len(chunk) == CHUNK_SIZE:
+            await _import_chunk(chunk, report)
+            chunk = []
+    if chunk:
+        await _import_chunk(chunk, report)
+
+    report["failed"] = len(report["errors"])
+    return report
@@ -0,0 +1,59 @@
+from tortoise import connections
+from tortoise.expressions import Q
+from app.models.assets import Asset
+
+# Must match the expression of the trigram index "idx_asset_search_trgm"
+# (migration 11) character for character, or PostgreSQL will not use it.
+SEARCH_DOCUMENT = """lower("asset_id" || ' ' || "name" || ' ' || "assigned" || ' ' || "department")"""
+
+RESULT_FIELDS = {
+    "id": "id",
+    "asset_id": "asset_id",
+    "company": "company_id",
+    "location": "location_id",
+    "name": "name",
+    "category": "category",
+    "department": "department",
+    "assigned": "assigned",
+    "status": "status",
+}
+
+POSTGRES_SEARCH = f"""
+SELECT {", ".join(f'"{column}" AS "{key}"' for key, column in RESULT_FIELDS.items())},
+       word_similarity($2, {SEARCH_DOCUMENT}) AS "rank"
+FROM "asset"
+WHERE "company_id" = $1 AND ({SEARCH_DOCUMENT} LIKE $3 OR $2 <% {SEARCH_DOCUMENT})
+ORDER BY "rank" DESC, "id"
+LIMIT $4 OFFSET $5
+"""
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+async def search_assets(company_id: int, q: str, limit: int, offset: int) -> list:
+    """
+    Assets of `company_id` whose asset ID, name, assignee or department
+    match `q`, best match first.
+
+    On PostgreSQL this is one query answered by the pg_trgm GIN index:
+    substring matches plus fuzzy (typo tolerant) word matches, ranked by
+    `word_similarity`. Other databases fall back to a case-insensitive
+    substring match ordered by name, with `rank` left empty.
+    """
+    term = q.strip().lower()
+    conn = connections.get("default")
+    if conn.capabilities.dialect == "postgres":
+        return await conn.execute_query_dict(POSTGRES_SEARCH, [company_id, term, _like_pattern(term), limit, offset])
+
+    rows = await (
+        Asset.filter(company_id=company_id)
+        .filter(Q(asset_id__icontains=term, name__icontains=term, assigned__icontains=term, department__icontains=term, join_type="OR"))
+        .order_by("name", "id").offset(offset).limit(limit)
+        .values(**RESULT_FIELDS)
+    )
+    for row in rows:
+        row["rank"] = None
+    return rows
@@ -0,0 +1,63 @@
+from tortoise.functions import Count, Sum
+from app.config import settings
+from app.models.assets import Asset
+from app.services.cache import LRUCache
+
+# Response key -> Asset column grouped on
+GROUPS = {
+    "by_category": "category",
+    "by_status": "status",
+    "by_location": "location_id",
+    "by_department": "department",
+}
+
+
+async def compute_stats(company_id: int) -> dict:
+    """Asset count and purchase value per category, status, location and department (one GROUP BY each)."""
+    stats = {"company": company_id}
+    for key, column in GROUPS.items():
+        rows = await (
+            Asset.filter(company_id=company_id)
+            .annotate(count=Count("id"), purchase_value=Sum("purchase_price"))
+            .group_by(column)
+            .values(column, "count", "purchase_value")
+        )
+        stats[key] = [
+            {"key": row[column], "count": row["count"], "purchase_value": row["purchase_value"] or 0}
+            for row in sorted(rows, key=lambda row: (row[column] is None, str(row[column])))
+        ]
+    # Every asset has exactly one status, so the status rollup also gives the totals
+    stats["total_count"] = sum(row["count"] for row in stats["by_status"])
+    stats["total_purchase_value"] = sum(row["purchase_value"] for row in stats["by_status"])
+    return stats
+
+
+class AssetStatsCache:
+    """
+    Per-company dashboard rollups, computed on a miss and kept until an asset
+    write of that company invalidates them (or the TTL expires, for writes
+    made by other processes).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = LRUCache(maxsize, ttl)
+
+    async def get(self, company_id: int) -> dict:
+        stats = self._cache.get(company_id)
+        if stats is None:
+            stats = await compute_stats(company_id)
+            self._cache.set(company_id, stats)
+        return stats
+
+    def invalidate(self, *company_ids: int):
+        for company_id in company_ids:
+            self._cache.pop(company_id)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+asset_stats_cache = AssetStatsCache(maxsize=settings.STATS_CACHE_SIZE, ttl=settings.STATS_CACHE_TTL)
@@ -0,0 +1,73 @@
+import heapq
+from datetime import date
+from tortoise.expressions import Q
+from app.models.assets import AssetDisposal, AssetTransfer, Maintenance
+from app.models.depreciation_history import DepreciationPosting
+
+# (event type, model, date column, detail columns); the position in this list
+# is the tie-break rank between events of different types on the same date.
+SOURCES = [
+    ("transfer", AssetTransfer, "transfer_date", [
+        "from_location_id", "from_department", "from_assigned",
+        "to_location_id", "to_department", "to_assigned", "transferred_by", "note",
+    ]),
+    ("maintenance", Maintenance, "scheduled_date", [
+        "task_id", "maintenance_type", "description", "cost", "vendor_id", "status",
+    ]),
+    ("depreciation", DepreciationPosting, "period", ["amount_ifrs", "amount_tax"]),
+    ("disposal", AssetDisposal, "disposal_date", ["method", "value_received", "approved_by", "note"]),
+]
+
+
+def encode_cursor(key) -> str:
+    event_date, rank, event_id = key
+    return f"{event_date.isoformat()}.{rank}.{event_id}"
+
+
+def decode_cursor(cursor: str):
+    """`(date, rank, id)` of an X-Next-Cursor value; ValueError if malformed."""
+    event_date, rank, event_id = cursor.split(".")
+    return date.fromisoformat(event_date), int(rank), int(event_id)
+
+
+def _before(date_column: str, rank: int, cursor):
+    """Keyset condition: events of this source that sort after `cursor` (newest first)."""
+    cursor_date, cursor_rank, cursor_id = cursor
+    if rank > cursor_rank:
+        return Q(**{f"{date_column}__lt": cursor_date})
+    if rank < cursor_rank:
+        return Q(**{f"{date_column}__lte": cursor_date})
+    return Q(**{f"{date_column}__lt": cursor_date}) | Q(**{date_column: cursor_date, "id__lt": cursor_id})
+
+
+async def _source_events(asset_id: int, rank: int, limit: int, cursor):
+    event_type, model, date_column, columns = SOURCES[rank]
+    query = model.filter(asset_id=asset_id)
+    if cursor:
+        query = query.filter(_before(date_column, rank, cursor))
+    rows = await query.order_by(f"-{date_column}", "-id").limit(limit).values("id", date_column, *columns)
+    return [
+        ((row[date_column], rank, row["id"]), {
+            "type": event_type,
+            "id": row["id"],
+            "date": row[date_column],
+            "details": {column: row[column] for column in columns},
+        })
+        for row in rows
+    ]
+
+
+async def asset_timeline(asset_id: int, limit: int, cursor=None):
+    """
+    One page of an asset's transfers, maintenance, depreciation postings and
+    disposal, newest first, and the cursor of the next page (None on the last).
+
+    Each source is read with one query on its (asset_id, date) index, limited
+    to the page size and started after the cursor; the sorted results are then
+    k-way merged on (date, source rank, id).
+    """
+    sources = [await _source_events(asset_id, rank, limit + 1, cursor) for rank in range(len(SOURCES))]
+    merged = list(heapq.merge(*sources, key=lambda event: event[0], reverse=True))
+    page = merged[:limit]
+    next_cursor = encode_cursor(page[-1][0]) if len(merged) > limit else None
+    return [event for _, event in page], next_cursor
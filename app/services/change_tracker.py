@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from app.models.change_version import ChangeVersion
+
+
+def validators(tag: str, modified: datetime = None) -> dict:
+    """
+    ETag / Last-Modified headers for revision `tag` last changed at `modified`.
+
+    Last-Modified has one-second resolution, so it is left out while the
+    newest change is in the current second: a later write in that same
+    second would otherwise carry the same Last-Modified and go unseen by
+    If-Modified-Since. The ETag changes with every write.
+    """
+    headers = {"ETag": f'W/"{tag}"'}
+    if modified and int(modified.timestamp()) < int(datetime.now(timezone.utc).timestamp()):
+        headers["Last-Modified"] = format_datetime(modified.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+    return headers
+
+
+def is_fresh(request, headers: dict) -> bool:
+    """Whether the client's copy (If-None-Match, else If-Modified-Since) matches `headers`."""
+    etag = headers["ETag"]
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags or etag[2:] in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or "Last-Modified" not in headers:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return parsedate_to_datetime(headers["Last-Modified"]) <= since
+
+
+async def bump(resource: str, *company_ids, using_db=None):
+    """
+    Record a write to `resource` for the given companies. Call it inside the
+    write's transaction (`using_db`), so the version moves exactly when the
+    data does.
+    """
+    now = datetime.now(timezone.utc)
+    # Fixed order, so two transactions bumping the same companies cannot deadlock
+    for company_id in sorted(set(company_ids)):
+        rows = ChangeVersion.filter(resource=resource, company_id=company_id).using_db(using_db)
+        if await rows.update(version=F("version") + 1, modified_at=now):
+            continue
+        try:
+            # Savepoint: a concurrent first bump of the same key must not abort the outer transaction
+            async with in_transaction() as savepoint:
+                await ChangeVersion.create(
+                    resource=resource, company_id=company_id, version=1, modified_at=now, using_db=savepoint
+                )
+        except IntegrityError:
+            await rows.update(version=F("version") + 1, modified_at=now)
+
+
+async def check(request, resource: str, company_id: int):
+    """
+    Validator headers of a company's `resource` rows, and whether the
+    client's copy is still current.
+
+    One lookup of the (resource, company) version row by its unique key,
+    whatever the number of rows it covers. The row lives in the shared
+    database, so every process hands out the same validators and sees a
+    write on the next request.
+    """
+    version = await ChangeVersion.filter(resource=resource, company_id=company_id).first().values(
+        "version", "modified_at"
+    )
+    if version:
+        headers = validators(f"{resource}-{company_id}-{version['version']}", version["modified_at"])
+    else:
+        headers = validators(f"{resource}-{company_id}-0")
+    return headers, is_fresh(request, headers)
+
+
+def check_stamps(request, stamps: list):
+    """
+    `check` for rows already loaded (e.g. from a cache), from their
+    `updated_at` values, so the validators describe exactly what is served.
+    """
+    known = [stamp for stamp in stamps if stamp]
+    modified = max(known) if known else None
+    stamp = int(modified.timestamp() * 1_000_000) if modified else 0
+    headers = validators(f"{len(stamps)}-{stamp}", modified)
+    return headers, is_fresh(request, headers)
@@ -0,0 +1,217 @@
+import numpy as np
+from app.models.assets import DepreciationMethod
+
+# 🚀 Vectorized Depreciation Engine
+#
+# Every function works on the whole batch of assets at once: inputs are
+# 1-D arrays (one element per asset) and schedules come back as a
+# (n_assets, max_useful_life) matrix. Periods past an asset's own useful
+# life are 0.
+
+
+def annual_depreciation(purchase_price, residual_value, useful_life, declining):
+    """
+    Annual depreciation amounts for a batch of assets on one book.
+
+    Straight line spreads (price - residual) evenly over the useful life.
+    Declining balance uses the double declining rate (2 / useful life) on the
+    opening book value, never goes below the residual value and writes the
+    remaining balance down to the residual value in the final year.
+    """
+    price = np.asarray(purchase_price, dtype=np.float64)
+    residual = np.minimum(np.asarray(residual_value, dtype=np.float64), price)
+    life = np.maximum(np.asarray(useful_life, dtype=np.int64), 1)
+    declining = np.asarray(declining, dtype=bool)
+
+    periods = int(life.max()) if life.size else 0
+    year = np.arange(periods)
+    in_life = year < life[:, None]
+
+    straight_line = np.broadcast_to(((price - residual) / life)[:, None], in_life.shape)
+
+    factor = np.clip(1.0 - 2.0 / life, 0.0, None)[:, None]
+    opening = np.maximum(price[:, None] * factor ** year, residual[:, None])
+    closing = np.maximum(opening * factor, residual[:, None])
+    closing = np.where(year == life[:, None] - 1, residual[:, None], closing)
+    declining_balance = opening - closing
+
+    amounts = np.where(declining[:, None], declining_balance, straight_line)
+    return np.where(in_life, amounts, 0.0)
+
+
+def compute_schedules(purchase_price, residual_value, useful_life_ifrs, useful_life_tax, method):
+    """
+    IFRS and tax annual schedules for a batch of assets.
+
+    Returns a tuple (ifrs, tax) of (n_assets, max_useful_life) matrices.
+    """
+    declining = np.asarray(method, dtype=object) != DepreciationMethod.STRAIGHT_LINE
+    ifrs = annual_depreciation(purchase_price, residual_value, useful_life_ifrs, declining)
+    tax = annual_depreciation(purchase_price, residual_value, useful_life_tax, declining)
+    return ifrs, tax
+
+
+def period_depreciation(annual, purchase_year, purchase_month, period_year, period_month):
+    """
+    Depreciation booked in one calendar month for every asset: 1/12 of the
+    annual amount of the asset year the month falls in, counting the
+    purchase month as the first month. 0 before purchase and after the
+    useful life.
+    """
+    months = (period_year - np.asarray(purchase_year, dtype=np.int64)) * 12 \
+        + (period_month - np.asarray(purchase_month, dtype=np.int64))
+    year = months // 12
+    in_life = (months >= 0) & (year < annual.shape[1])
+    index = np.clip(year, 0, max(annual.shape[1] - 1, 0))
+    amounts = annual[np.arange(annual.shape[0]), index] / 12
+    return np.where(in_life, amounts, 0.0)
+
+
+def accumulated_depreciation(purchase_price, residual_value, useful_life, declining, months):
+    """
+    Accumulated depreciation after `months` booked months, in closed form
+    (no schedule is built). Consistent with `annual_depreciation` and
+    `period_depreciation`: each month books 1/12 of its asset year's amount.
+    """
+    price = np.asarray(purchase_price, dtype=np.float64)
+    residual = np.minimum(np.asarray(residual_value, dtype=np.float64), price)
+    life = np.maximum(np.asarray(useful_life, dtype=np.int64), 1)
+    declining = np.asarray(declining, dtype=bool)
+    months = np.clip(np.asarray(months, dtype=np.int64), 0, life * 12)
+
+    years = months // 12
+    partial = (months % 12) / 12
+
+    straight_line = (price - residual) * months / (life * 12)
+
+    factor = np.clip(1.0 - 2.0 / life, 0.0, None)
+    opening = np.where(years >= life, residual, np.maximum(price * factor ** years, residual))
+    closing = np.where(years >= life - 1, residual, np.maximum(opening * factor, residual))
+    declining_balance = price - opening + partial * (opening - closing)
+
+    return np.where(declining, declining_balance, straight_line)
+
+
+def months_booked(purchase_date_ordinal, purchase_year, purchase_month, as_of):
+    """Months booked up to and including the month of `as_of` (0 before purchase)."""
+    months = (as_of.year - np.asarray(purchase_year, dtype=np.int64)) * 12 \
+        + (as_of.month - np.asarray(purchase_month, dtype=np.int64)) + 1
+    return np.where(np.asarray(purchase_date_ordinal) <= as_of.toordinal(), months, 0)
+
+
+def net_book_value(purchase_price, residual_value, useful_life_ifrs, useful_life_tax, method, months):
+    """
+    Accumulated depreciation and net book value on both books.
+
+    Returns a tuple (accumulated_ifrs, nbv_ifrs, accumulated_tax, nbv_tax).
+    """
+    price = np.asarray(purchase_price, dtype=np.float64)
+    declining = np.asarray(method, dtype=object) != DepreciationMethod.STRAIGHT_LINE
+    accumulated_ifrs = accumulated_depreciation(price, residual_value, useful_life_ifrs, declining, months)
+    accumulated_tax = accumulated_depreciation(price, residual_value, useful_life_tax, declining, months)
+    return accumulated_ifrs, price - accumulated_ifrs, accumulated_tax, price - accumulated_tax
+
+
+def columnar_book(annual, useful_life):
+    """
+    One book of a batch as parallel arrays: the amounts of all assets
+    flattened into `annual`, with asset i's periods at
+    annual[offsets[i]:offsets[i + 1]]. Monthly amounts are annual / 12.
+    """
+    life = np.asarray(useful_life, dtype=np.int64)
+    in_life = np.arange(annual.shape[1]) < life[:, None]
+    return {
+        "useful_life": life.tolist(),
+        "offsets": np.concatenate(([0], np.cumsum(life))).tolist(),
+        "annual": np.round(annual[in_life], 2).tolist(),
+    }
+
+
+def _book_rows(annual, useful_life, book):
+    """Legacy per-period payload (`{"1_year": ..}` / `{"1_month": ..}`) for every asset of one book."""
+    yearly = np.round(annual, 2).tolist()
+    monthly = np.round(annual / 12, 2).tolist()
+    rows = []
+    for years, months, life in zip(yearly, monthly, useful_life):
+        rows.append({
+            f"annual_depreciation_{book}": [{f"{i+1}_year": years[i]} for i in range(life)],
+            f"monthly_depreciation_{book}": [{f"{i+1}_month": months[i]} for i in range(life)],
+        })
+    return rows
+
+
+def _compute_batch(assets, policies, prices=None):
+    if prices is None:
+        prices = [asset.purchase_price for asset in assets]
+    useful_life_ifrs = [int(policies[asset.category].useful_life_ifrs) for asset in assets]
+    useful_life_tax = [int(policies[asset.category].useful_life_tax) for asset in assets]
+    ifrs, tax = compute_schedules(
+        np.asarray(prices, dtype=np.float64),
+        [policies[asset.category].residual_value for asset in assets],
+        useful_life_ifrs,
+        useful_life_tax,
+        [asset.depreciation_method for asset in assets],
+    )
+    return ifrs, tax, useful_life_ifrs, useful_life_tax
+
+
+def build_schedules(assets, policies, prices=None):
+    """
+    Depreciation schedules for a list of assets in the API response format.
+
+    `policies` maps a category to its `Depreciation` row and must cover every
+    asset category. `prices` optionally overrides the purchase prices (e.g.
+    fair values for an impairment run).
+    """
+    ifrs, tax, useful_life_ifrs, useful_life_tax = _compute_batch(assets, policies, prices)
+    ifrs_rows = _book_rows(ifrs, useful_life_ifrs, "ifrs")
+    tax_rows = _book_rows(tax, useful_life_tax, "tax")
+
+    return [
+        {
+            "asset_id": asset.id,
+            "asset_name": asset.name,
+            "asset_category": asset.category,
+            "depreciation_method": asset.depreciation_method,
+            "depreciation_ifrs": ifrs_row,
+            "depreciation_tax": tax_row,
+        }
+        for asset, ifrs_row, tax_row in zip(assets, ifrs_rows, tax_rows)
+    ]
+
+
+def columnar_schedules(assets, policies, prices=None):
+    """Same schedules as `build_schedules`, as parallel arrays (see `columnar_book`)."""
+    ifrs, tax, useful_life_ifrs, useful_life_tax = _compute_batch(assets, policies, prices)
+    return {
+        "asset_id": [asset.id for asset in assets],
+        "asset_name": [asset.name for asset in assets],
+        "asset_category": [asset.category for asset in assets],
+        "depreciation_method": [asset.depreciation_method for asset in assets],
+        "depreciation_ifrs": columnar_book(ifrs, useful_life_ifrs),
+        "depreciation_tax": columnar_book(tax, useful_life_tax),
+    }
+
+
+def packed_schedules(assets, policies, prices=None) -> bytes:
+    """
+    Same schedules as a packed little-endian buffer, for n assets:
+
+        int64[n]    asset ids
+        int64[n]    IFRS useful lives
+        int64[n]    tax useful lives
+        float64[*]  IFRS annual amounts, sum(IFRS lives) values
+        float64[*]  tax annual amounts, sum(tax lives) values
+
+    Amounts are grouped per asset in the order of the ids, like `columnar_book`.
+    """
+    ifrs, tax, useful_life_ifrs, useful_life_tax = _compute_batch(assets, policies, prices)
+    ifrs_life = np.asarray(useful_life_ifrs, dtype="<i8")
+    tax_life = np.asarray(useful_life_tax, dtype="<i8")
+    return b"".join([
+        np.asarray([asset.id for asset in assets], dtype="<i8").tobytes(),
+        ifrs_life.tobytes(),
+        tax_life.tobytes(),
+        np.round(ifrs[np.arange(ifrs.shape[1]) < ifrs_life[:, None]], 2).astype("<f8").tobytes(),
+        np.round(tax[np.arange(tax.shape[1]) < tax_life[:, None]], 2).astype("<f8").tobytes(),
+    ])
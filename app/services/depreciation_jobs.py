@@ -0,0 +1,142 @@
+import asyncio
+import uuid
+from datetime import timedelta
+from tortoise import timezone
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+from app.config import settings
+from app.models.assets import Asset
+from app.models.depreciation_job import DepreciationJob, JobStatus
+from app.services.policy_cache import policy_cache
+from app.services.schedule_store import get_schedules
+
+
+class LeaseLost(Exception):
+    """The job's lease expired and another runner reclaimed it."""
+
+
+class DepreciationJobRunner:
+    """
+    Worker tasks for whole-company depreciation runs, safe to start in every
+    process.
+
+    Jobs live in the `DepreciationJob` table. A worker claims one with a
+    conditional UPDATE that records this process' `owner` token and a
+    `heartbeat_at`, so exactly one runner wins each job. The heartbeat is
+    renewed with every chunk; a running job is only reclaimed once it is
+    older than `lease` seconds, i.e. its process stopped or hung. Every
+    write of a running job is guarded by the owner token, so a runner that
+    lost its lease stops instead of clobbering the new owner's progress.
+
+    Each chunk of assets is committed to DepreciationHistory together with
+    the job progress, in one transaction (the schedule store's own
+    transaction becomes a savepoint in it). Workers poll for jobs every
+    `poll_interval` seconds; a submit wakes a local worker at once.
+    """
+
+    def __init__(self, workers: int, chunk_size: int, lease: int, poll_interval: float):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.token = uuid.uuid4().hex
+        self.queue = asyncio.Queue()
+        self._tasks = []
+
+    async def start(self):
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Hand unfinished jobs back right away instead of waiting for the lease to expire
+        await DepreciationJob.filter(status=JobStatus.RUNNING, owner=self.token).update(
+            status=JobStatus.QUEUED, owner=None, heartbeat_at=None
+        )
+
+    async def submit(self, company_id: int) -> DepreciationJob:
+        total = await Asset.filter(company_id=company_id).count()
+        job = await DepreciationJob.create(company_id=company_id, total=total)
+        self.queue.put_nowait(job.id)
+        return job
+
+    def _claimable(self, now) -> Q:
+        expired = Q(heartbeat_at__lt=now - timedelta(seconds=self.lease)) | Q(heartbeat_at__isnull=True)
+        return Q(status=JobStatus.QUEUED) | (Q(status=JobStatus.RUNNING) & expired)
+
+    async def _claim(self):
+        """Id of a job this runner now owns, or None when there is nothing to run."""
+        now = timezone.now()
+        candidates = await (
+            DepreciationJob.filter(self._claimable(now)).order_by("created_at").limit(self.workers)
+            .values_list("id", flat=True)
+        )
+        for job_id in candidates:
+            # Re-checked by the UPDATE itself: of concurrent claims only one matches
+            claimed = await DepreciationJob.filter(self._claimable(now), id=job_id).update(
+                status=JobStatus.RUNNING, owner=self.token, heartbeat_at=now,
+                started_at=now, processed=0, skipped=0, error=None,
+            )
+            if claimed:
+                return job_id
+        return None
+
+    def _owned(self, job_id):
+        return DepreciationJob.filter(id=job_id, owner=self.token, status=JobStatus.RUNNING)
+
+    async def _worker(self):
+        while True:
+            job_id = await self._claim()
+            if job_id is None:
+                try:
+                    await asyncio.wait_for(self.queue.get(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except LeaseLost:
+                pass
+            except Exception as exc:
+                await self._owned(job_id).update(
+                    status=JobStatus.FAILED, error=str(exc), finished_at=timezone.now()
+                )
+
+    async def _run(self, job_id):
+        job = await DepreciationJob.get(id=job_id)
+        policies = await policy_cache.get_all()
+        processed = skipped = last_id = 0
+        while True:
+            assets = await Asset.filter(company_id=job.company_id, id__gt=last_id).order_by("id").limit(self.chunk_size)
+            if not assets:
+                break
+            last_id = assets[-1].id
+
+            covered = [asset for asset in assets if asset.category in policies]
+            async with in_transaction() as conn:
+                await get_schedules(covered, policies)
+                renewed = await self._owned(job_id).using_db(conn).update(
+                    processed=processed + len(covered),
+                    skipped=skipped + len(assets) - len(covered),
+                    heartbeat_at=timezone.now(),
+                )
+                if not renewed:
+                    raise LeaseLost(job_id)
+            processed += len(covered)
+            skipped += len(assets) - len(covered)
+
+        await self._owned(job_id).update(
+            status=JobStatus.COMPLETED, total=processed + skipped, finished_at=timezone.now()
+        )
+
+
+depreciation_jobs = DepreciationJobRunner(
+    workers=settings.DEPRECIATION_JOB_WORKERS,
+    chunk_size=settings.DEPRECIATION_JOB_CHUNK_SIZE,
+    lease=settings.DEPRECIATION_JOB_LEASE,
+    poll_interval=settings.DEPRECIATION_JOB_POLL_INTERVAL,
+)
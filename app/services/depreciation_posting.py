@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+from app.models.assets import Asset, held_on
+from app.models.depreciation_history import DepreciationPosting
+from app.services.depreciation_engine import compute_schedules, period_depreciation
+from app.services.policy_cache import policy_cache
+
+BATCH_SIZE = 1000
+
+
+def _next_month(period: date) -> date:
+    return date(period.year + period.month // 12, period.month % 12 + 1, 1)
+
+
+async def post_period(company_id: int, period: date) -> dict:
+    """
+    Write one DepreciationPosting per asset of the company for the month of
+    `period`: every asset purchased by and still held at the month's end,
+    so past periods still include assets disposed since.
+
+    Assets are read and posted in batches of BATCH_SIZE with `bulk_create`,
+    all in one transaction. Assets already posted for the period are
+    skipped, so running the same period twice posts nothing new. `posted`
+    counts the rows this run inserted (they share its `posted_at`); rows a
+    concurrent run got in first count as `already_posted`.
+    """
+    period = period.replace(day=1)
+    period_end = _next_month(period) - timedelta(days=1)
+    policies = await policy_cache.get_all()
+    attempted = already_posted = 0
+    last_id = 0
+    now = timezone.now()
+
+    async with in_transaction() as conn:
+        existing = set(
+            await DepreciationPosting.filter(company_id=company_id, period=period)
+            .using_db(conn).values_list("asset_id", flat=True)
+        )
+        while True:
+            assets = await (
+                Asset.filter(held_on(period_end), company_id=company_id, id__gt=last_id, purchase_date__lte=period_end)
+                .order_by("id").limit(BATCH_SIZE).using_db(conn)
+                .values("id", "category", "purchase_price", "purchase_date", "depreciation_method")
+            )
+            if not assets:
+                break
+            last_id = assets[-1]["id"]
+
+            pending = [
+                asset for asset in assets
+                if asset["id"] not in existing and asset["category"] in policies
+            ]
+            already_posted += sum(1 for asset in assets if asset["id"] in existing)
+            if not pending:
+                continue
+
+            ifrs, tax = compute_schedules(
+                [asset["purchase_price"] for asset in pending],
+                [policies[asset["category"]].residual_value for asset in pending],
+                [policies[asset["category"]].useful_life_ifrs for asset in pending],
+                [policies[asset["category"]].useful_life_tax for asset in pending],
+                [asset["depreciation_method"] for asset in pending],
+            )
+            purchase_year = [asset["purchase_date"].year for asset in pending]
+            purchase_month = [asset["purchase_date"].month for asset in pending]
+            amounts_ifrs = period_depreciation(ifrs, purchase_year, purchase_month, period.year, period.month)
+            amounts_tax = period_depreciation(tax, purchase_year, purchase_month, period.year, period.month)
+
+            postings = [
+                DepreciationPosting(
+                    asset_id=asset["id"],
+                    company_id=company_id,
+                    period=period,
+                    amount_ifrs=Decimal(f"{amount_ifrs:.2f}"),
+                    amount_tax=Decimal(f"{amount_tax:.2f}"),
+                    posted_at=now,
+                )
+                for asset, amount_ifrs, amount_tax in zip(pending, amounts_ifrs.tolist(), amounts_tax.tolist())
+                if amount_ifrs > 0 or amount_tax > 0
+            ]
+            await DepreciationPosting.bulk_create(postings, batch_size=BATCH_SIZE, ignore_conflicts=True, using_db=conn)
+            attempted += len(postings)
+
+        posted = await DepreciationPosting.filter(
+            company_id=company_id, period=period, posted_at=now
+        ).using_db(conn).count()
+        already_posted += attempted - posted
+
+    return {"company": company_id, "period": period, "posted": posted, "already_posted": already_posted}
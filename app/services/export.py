@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+from tortoise import connections
+from tortoise.fields import DecimalField
+from app.models.assets import Asset, AssetDisposal, AssetTransfer, Maintenance
+
+BATCH_SIZE = 2000
+
+# dataset -> (model, date column used by date_from/date_to, exported columns)
+EXPORTS = {
+    "assets": (Asset, "purchase_date", [
+        "id", "asset_id", "company_id", "location_id", "name", "category", "department", "assigned",
+        "purchase_price", "purchase_date", "status", "depreciation_method",
+    ]),
+    "transfers": (AssetTransfer, "transfer_date", [
+        "id", "asset_id", "company_id", "from_location_id", "from_department", "from_assigned",
+        "to_location_id", "to_department", "to_assigned", "transferred_by", "transfer_date", "note",
+    ]),
+    "disposals": (AssetDisposal, "disposal_date", [
+        "id", "asset_id", "company_id", "method", "disposal_date", "value_received", "note", "approved_by",
+    ]),
+    "maintenance": (Maintenance, "scheduled_date", [
+        "id", "task_id", "asset_id", "company_id", "vendor_id", "maintenance_type", "description",
+        "scheduled_date", "cost", "status",
+    ]),
+}
+
+
+async def _cursor_batches(conn, model, columns, filters):
+    """Batches of row tuples from a PostgreSQL server-side cursor."""
+    selected = ", ".join(f'"{column}"' for column in columns)
+    conditions = [f'"{column}" {operator} ${i + 1}' for i, (column, operator, _) in enumerate(filters)]
+    sql = (
+        f'SELECT {selected} FROM "{model._meta.db_table}"'
+        + (f' WHERE {" AND ".join(conditions)}' if conditions else "")
+        + ' ORDER BY "id"'
+    )
+    async with conn.acquire_connection() as connection:
+        # Cursors only live inside a transaction; it is read-only and never commits anything
+        async with connection.transaction(readonly=True):
+            cursor = await connection.cursor(sql, *(value for _, _, value in filters))
+            while True:
+                records = await cursor.fetch(BATCH_SIZE)
+                if not records:
+                    break
+                yield [tuple(record) for record in records]
+
+
+async def _keyset_batches(model, columns, filters):
+    """Batches of row tuples paged by primary key, for databases without server-side cursors."""
+    lookups = {"=": "", ">=": "__gte", "<=": "__lte"}
+    query = model.filter(**{f"{column}{lookups[operator]}": value for column, operator, value in filters})
+    last_id = None
+    while True:
+        page = query if last_id is None else query.filter(id__gt=last_id)
+        rows = await page.order_by("id").limit(BATCH_SIZE).values_list(*columns)
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        yield rows
+
+
+def _decimal_columns(model, columns):
+    """(position, quantum) of each DecimalField column, e.g. (8, Decimal("0.01"))."""
+    fields = model._meta.fields_map
+    return [
+        (i, Decimal(1).scaleb(-fields[column].decimal_places))
+        for i, column in enumerate(columns)
+        if isinstance(fields.get(column), DecimalField)
+    ]
+
+
+def _format_decimals(row, decimals):
+    # Tortoise normalizes Decimals (10000.00 -> 1E+4); write every backend's value as fixed-point
+    row = list(row)
+    for i, quantum in decimals:
+        if row[i] is not None:
+            row[i] = format(row[i].quantize(quantum), "f")
+    return row
+
+
+async def _batches(dataset: str, company_id: int = None, date_from: date = None, date_to: date = None):
+    model, date_column, columns = EXPORTS[dataset]
+    filters = []
+    if company_id is not None:
+        filters.append(("company_id", "=", company_id))
+    if date_from:
+        filters.append((date_column, ">=", date_from))
+    if date_to:
+        filters.append((date_column, "<=", date_to))
+
+    conn = connections.get("default")
+    if conn.capabilities.dialect == "postgres":
+        batches = _cursor_batches(conn, model, columns, filters)
+    else:
+        batches = _keyset_batches(model, columns, filters)
+    decimals = _decimal_columns(model, columns)
+    async for rows in batches:
+        yield [_format_decimals(row, decimals) for row in rows] if decimals else rows
+
+
+async def export_csv(dataset: str, **filters):
+    """
+    CSV of a whole dataset, header first, written BATCH_SIZE rows at a time.
+
+    The header is sent before the query runs; afterwards only one batch is
+    held in memory, however large the export.
+    """
+    columns = EXPORTS[dataset][2]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    async for rows in _batches(dataset, **filters):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
+
+
+async def export_columnar(dataset: str, **filters):
+    """
+    NDJSON of a whole dataset: a `{"columns": [...]}` line, then one line per
+    batch holding each column's values as a list (`{"rows": n, "data": [[...], ...]}`).
+    """
+    yield json.dumps({"columns": EXPORTS[dataset][2]}) + "\n"
+    async for rows in _batches(dataset, **filters):
+        yield json.dumps({"rows": len(rows), "data": [list(column) for column in zip(*rows)]}, default=str) + "\n"
@@ -0,0 +1,99 @@
+import asyncio
+from collections import defaultdict
+from tortoise import connections
+from tortoise.backends.base.client import TransactionalDBClient
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from app.config import settings
+from app.models.sequence import IdSequence
+
+# Sequences start above the legacy 4-digit range; the wider zero padding
+# also keeps every new ID distinct from the old ones (e.g. AST-1234).
+FIRST_VALUE = 10000
+ID_FORMATS = {
+    "asset": ("AST", 8),
+    "vendor": ("VEN", 8),
+    "maintenance": ("MAIN", 7),
+}
+
+
+def _committing_client():
+    """
+    A client whose transactions commit on their own, even when the caller
+    is inside a transaction: the pool behind that transaction. None on a
+    single-connection backend (SQLite) while the caller holds a transaction,
+    since any reservation there can only join it.
+    """
+    client = connections.get("default")
+    if not isinstance(client, TransactionalDBClient):
+        return client
+    while isinstance(client, TransactionalDBClient):
+        client = client._parent
+    return None if client.capabilities.dialect == "sqlite" else client
+
+
+class IdAllocator:
+    """
+    Collision-free business IDs from blocks reserved in `IdSequence`.
+
+    Each process reserves `block_size` numbers at a time with one atomic
+    UPDATE, then hands them out from memory, so most creates cost no query.
+    Numbers left in a block when the process stops are skipped, never reused.
+
+    A block is reserved in its own transaction and cached only once that
+    has committed, so a caller's rollback cannot hand its numbers out again.
+    Where that is impossible (a caller transaction on SQLite), only the
+    numbers needed are reserved, inside the caller's transaction, and
+    nothing is cached.
+    """
+
+    def __init__(self, block_size: int):
+        self.block_size = block_size
+        self._blocks = {}
+        self._locks = defaultdict(asyncio.Lock)
+
+    async def _reserve(self, client, name: str, size: int):
+        for _ in range(2):
+            async with client._in_transaction() as conn:
+                updated = await IdSequence.filter(name=name).using_db(conn).update(next_value=F("next_value") + size)
+                if updated:
+                    sequence = await IdSequence.filter(name=name).using_db(conn).get()
+                    return sequence.next_value - size, sequence.next_value
+            try:
+                async with client._in_transaction() as conn:
+                    await IdSequence.create(name=name, next_value=FIRST_VALUE + size, using_db=conn)
+                return FIRST_VALUE, FIRST_VALUE + size
+            except IntegrityError:
+                # Another process created the sequence first; reserve from it
+                continue
+        raise RuntimeError(f"Could not reserve IDs for {name}")
+
+    async def take(self, name: str, count: int = 1):
+        """Reserve `count` consecutive-as-possible numbers of sequence `name`."""
+        async with self._locks[name]:
+            client = _committing_client()
+            numbers = []
+            while len(numbers) < count:
+                start, end = self._blocks.get(name, (0, 0))
+                if start >= end:
+                    needed = count - len(numbers)
+                    if client is None:
+                        start, end = await self._reserve(connections.get("default"), name, needed)
+                        numbers.extend(range(start, end))
+                        break
+                    start, end = await self._reserve(client, name, max(self.block_size, needed))
+                taken = min(end - start, count - len(numbers))
+                numbers.extend(range(start, start + taken))
+                self._blocks[name] = (start + taken, end)
+            return numbers
+
+    async def next_ids(self, name: str, count: int):
+        """`count` formatted business IDs (e.g. AST-00010001) of sequence `name`."""
+        prefix, width = ID_FORMATS[name]
+        return [f"{prefix}-{number:0{width}d}" for number in await self.take(name, count)]
+
+    async def next_id(self, name: str):
+        return (await self.next_ids(name, 1))[0]
+
+
+id_allocator = IdAllocator(block_size=settings.ID_BLOCK_SIZE)
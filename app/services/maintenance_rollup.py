@@ -0,0 +1,103 @@
+"""
+Maintenance cost rollups: total cost and task count per (company, asset, vendor, month),
+kept up to date by the maintenance write routes.
+
+Rebuild them from the maintenance table (all companies, or one) with:
+
+    python -m app.services.maintenance_rollup [--company-id 1]
+"""
+import argparse
+import asyncio
+from decimal import Decimal
+from tortoise import Tortoise, connections
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from app.models.maintenance_cost import MaintenanceCostRollup
+
+MONTH_SQL = {
+    "postgres": """date_trunc('month', "scheduled_date")::date""",
+    "sqlite": """date("scheduled_date", 'start of month')""",
+}
+PLACEHOLDER = {"postgres": "$1", "sqlite": "?"}
+
+REBUILD_SQL = """
+INSERT INTO "maintenancecostrollup" ("company_id", "asset_id", "vendor_id", "month", "total_cost", "task_count")
+SELECT "company_id", "asset_id", COALESCE("vendor_id", 0), {month}, SUM("cost"), COUNT(*)
+FROM "maintenance" {where}
+GROUP BY 1, 2, 3, 4
+"""
+
+
+def rollup_key(maintenance) -> dict:
+    return {
+        "company_id": maintenance.company_id,
+        "asset_id": maintenance.asset_id,
+        "vendor_id": maintenance.vendor_id or 0,
+        "month": maintenance.scheduled_date.replace(day=1),
+    }
+
+
+async def apply_cost(conn, key: dict, cost: Decimal, tasks: int):
+    """Add `cost` and `tasks` (negative to remove) to the rollup row of `key`, creating it if needed."""
+    rows = MaintenanceCostRollup.filter(**key).using_db(conn)
+    if await rows.update(total_cost=F("total_cost") + cost, task_count=F("task_count") + tasks):
+        return
+    try:
+        # Savepoint: a concurrent first insert of the same key must not abort the outer transaction
+        async with in_transaction() as savepoint:
+            await MaintenanceCostRollup.create(
+                total_cost=cost, task_count=tasks, using_db=savepoint, **key
+            )
+    except IntegrityError:
+        await rows.update(total_cost=F("total_cost") + cost, task_count=F("task_count") + tasks)
+
+
+async def record_created(conn, maintenance):
+    await apply_cost(conn, rollup_key(maintenance), Decimal(str(maintenance.cost)), 1)
+
+
+async def record_updated(conn, before: dict, before_cost: Decimal, maintenance):
+    """Move a task's cost from its old rollup row (`before` key, `before_cost`) to its current one."""
+    after = rollup_key(maintenance)
+    after_cost = Decimal(str(maintenance.cost))
+    if before == after:
+        if after_cost != before_cost:
+            await apply_cost(conn, after, after_cost - before_cost, 0)
+        return
+    await apply_cost(conn, before, -before_cost, -1)
+    await apply_cost(conn, after, after_cost, 1)
+
+
+async def rebuild_rollups(company_id: int = None) -> int:
+    """
+    Recompute the rollups from scratch with one DELETE and one INSERT ... SELECT
+    ... GROUP BY, in a transaction. Incremental updates made while it runs
+    can be lost, so run it when maintenance is not being written.
+    """
+    dialect = connections.get("default").capabilities.dialect
+    where = f'WHERE "company_id" = {PLACEHOLDER[dialect]}' if company_id is not None else ""
+    values = [company_id] if company_id is not None else []
+    async with in_transaction() as conn:
+        rollups = MaintenanceCostRollup.all().using_db(conn)
+        if company_id is not None:
+            rollups = rollups.filter(company_id=company_id)
+        await rollups.delete()
+        await conn.execute_query(REBUILD_SQL.format(month=MONTH_SQL[dialect], where=where), values)
+        return await rollups.count()
+
+
+async def _main(company_id: int = None):
+    from app.database import TORTOISE_ORM
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        rows = await rebuild_rollups(company_id)
+        print(f"✅ Rebuilt {rows} maintenance cost rollup rows")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild maintenance cost rollups from the maintenance table")
+    parser.add_argument("--company-id", type=int, help="only this company (default: all)")
+    asyncio.run(_main(parser.parse_args().company_id))
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import date
+from tortoise.expressions import Subquery
+from app.config import settings
+from app.models.assets import Maintenance
+
+
+class MaintenanceScheduler:
+    """
+    Periodic in-process task that moves due maintenance out of `scheduled`:
+    tasks scheduled for today become `in_progress`, overdue ones `incomplete`.
+
+    Each pass is a few set-based UPDATEs of at most `batch_size` rows, driven
+    by the (status, scheduled_date) index, so it stays cheap however many
+    tasks exist. Every process runs it; the `status = 'scheduled'` guard makes
+    concurrent passes harmless.
+    """
+
+    def __init__(self, interval: float, batch_size: int):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task = None
+
+    async def start(self):
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                print(f"⚠️ Maintenance status update failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    async def _transition(self, status: str, **scheduled) -> int:
+        updated = 0
+        while True:
+            batch = Maintenance.filter(status="scheduled", **scheduled).limit(self.batch_size).values("id")
+            count = await Maintenance.filter(id__in=Subquery(batch), status="scheduled").update(status=status)
+            updated += count
+            if count < self.batch_size:
+                return updated
+
+    async def run_once(self, today: date = None) -> dict:
+        today = today or date.today()
+        return {
+            "in_progress": await self._transition("in_progress", scheduled_date=today),
+            "incomplete": await self._transition("incomplete", scheduled_date__lt=today),
+        }
+
+
+maintenance_scheduler = MaintenanceScheduler(
+    interval=settings.MAINTENANCE_SCHEDULER_INTERVAL,
+    batch_size=settings.MAINTENANCE_SCHEDULER_BATCH_SIZE,
+)
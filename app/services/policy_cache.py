@@ -0,0 +1,50 @@
+import asyncio
+import time
+from app.config import settings
+from app.models.depreciation import Depreciation
+
+
+class PolicyCache:
+    """
+    In-process cache of the `Depreciation` category policies.
+
+    The whole table (a handful of categories) is loaded with one query on
+    first use and kept until the depreciation setup routes invalidate it.
+    The TTL bounds how long a change made by another process can go unseen.
+    `version` is bumped on every invalidation.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._policies = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self._policies is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def get_all(self) -> dict:
+        """All policies keyed by category."""
+        if self._fresh():
+            return self._policies
+        async with self._lock:
+            if self._fresh():
+                return self._policies
+            version = self.version
+            policies = {policy.category: policy for policy in await Depreciation.all()}
+            # Don't keep a snapshot that was invalidated while it was loading
+            if version == self.version:
+                self._policies = policies
+                self._loaded_at = time.monotonic()
+            return policies
+
+    async def get(self, category: str):
+        return (await self.get_all()).get(category)
+
+    def invalidate(self):
+        self.version += 1
+        self._policies = None
+
+
+policy_cache = PolicyCache(ttl=settings.POLICY_CACHE_TTL)
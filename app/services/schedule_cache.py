@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+from app.config import settings
+from app.models.assets import Asset
+from app.services.cache import LRUCache
+from app.services.policy_cache import policy_cache
+from app.services.schedule_store import FINGERPRINT_FIELDS, fingerprint
+
+
+class ScheduleCache:
+    """
+    LRU cache of single-asset schedules keyed by (asset id, asset revision,
+    policy version).
+
+    Lookups go by asset id. A hit is checked against the policy cache
+    (version) and against the asset's current revision: the fingerprint of
+    the schedule inputs, read by primary key. A write that changes those
+    inputs therefore never serves a stale schedule, even if it forgets
+    `invalidate_asset`.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = LRUCache(maxsize, ttl)
+
+    async def get(self, asset_id: int):
+        entry = self._cache.get(asset_id)
+        if entry is None:
+            return None
+        revision, category, policy_version, schedule = entry
+        policy = await policy_cache.get(category)
+        if policy is None or policy.version != policy_version:
+            self._cache.pop(asset_id)
+            return None
+        current = await Asset.filter(id=asset_id).first().values(*FINGERPRINT_FIELDS)
+        if current is None or fingerprint(SimpleNamespace(**current), policy) != revision:
+            self._cache.pop(asset_id)
+            return None
+        return schedule
+
+    def set(self, asset, policy, schedule):
+        self._cache.set(asset.id, (fingerprint(asset, policy), asset.category, policy.version, schedule))
+
+    def invalidate_asset(self, asset_id: int):
+        self._cache.pop(asset_id)
+
+    def invalidate_category(self, category: str):
+        self._cache.discard_where(lambda entry: entry[1] == category)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+schedule_cache = ScheduleCache(maxsize=settings.SCHEDULE_CACHE_SIZE, ttl=settings.SCHEDULE_CACHE_TTL)
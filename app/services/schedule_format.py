@@ -0,0 +1,34 @@
+from fastapi import Response
+from app.services.depreciation_engine import columnar_schedules, packed_schedules
+
+# 🚀 Opt-in Compact Schedule Formats
+#
+# `?format=` wins over the Accept header; without either the routes keep
+# their per-period JSON payload.
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.asseter.columnar+json"
+BINARY_MEDIA_TYPE = "application/octet-stream"
+FORMAT_PATTERN = "^(json|ndjson|columnar|binary)$"  # list routes, which can stream ndjson
+SINGLE_FORMAT_PATTERN = "^(json|columnar|binary)$"
+
+
+def negotiate_format(format: str = None, accept: str = None) -> str:
+    if format:
+        return format
+    accept = accept or ""
+    if BINARY_MEDIA_TYPE in accept:
+        return "binary"
+    if COLUMNAR_MEDIA_TYPE in accept:
+        return "columnar"
+    return "json"
+
+
+def compact_response(format: str, assets, policies, prices=None):
+    """Columnar JSON or packed binary schedules (see `packed_schedules` for the layout)."""
+    if format == "binary":
+        return Response(
+            content=packed_schedules(assets, policies, prices),
+            media_type=BINARY_MEDIA_TYPE,
+            headers={"X-Asset-Count": str(len(assets))},
+        )
+    return columnar_schedules(assets, policies, prices)
@@ -0,0 +1,110 @@
+import hashlib
+from datetime import date
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+from app.models.depreciation_history import DepreciationHistory
+from app.services.depreciation_engine import build_schedules
+
+# 🚀 Materialized Depreciation Schedules
+#
+# One DepreciationHistory row per (asset, category, policy version) holds the
+# computed books of that asset. A row is reused for as long as its
+# fingerprint matches the asset's price, category, method and policy values;
+# otherwise the asset is recomputed with the engine and the row replaced.
+
+CHUNK_SIZE = 1000
+
+
+# Asset columns `fingerprint` reads
+FINGERPRINT_FIELDS = ("purchase_price", "category", "depreciation_method")
+
+
+def fingerprint(asset, policy) -> str:
+    """Hash of every input the stored schedule of `asset` depends on."""
+    raw = "|".join([
+        format(float(asset.purchase_price), ".2f"),
+        asset.category,
+        asset.depreciation_method,
+        str(policy.residual_value),
+        str(policy.useful_life_ifrs),
+        str(policy.useful_life_tax),
+    ])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _current_versions(policies) -> Q:
+    return Q(
+        *[Q(category=category, policy_version=policy.version) for category, policy in policies.items()],
+        join_type="OR",
+    )
+
+
+def _payload(asset, books):
+    return {
+        "asset_id": asset.id,
+        "asset_name": asset.name,
+        "asset_category": asset.category,
+        "depreciation_method": asset.depreciation_method,
+        "depreciation_ifrs": books["depreciation_ifrs"],
+        "depreciation_tax": books["depreciation_tax"],
+    }
+
+
+async def _store(assets, schedules, policies):
+    rows = [
+        DepreciationHistory(
+            asset_id=asset.id,
+            category=asset.category,
+            policy_version=policies[asset.category].version,
+            fingerprint=fingerprint(asset, policies[asset.category]),
+            depreciation={
+                "depreciation_ifrs": schedule["depreciation_ifrs"],
+                "depreciation_tax": schedule["depreciation_tax"],
+            },
+            update_date=date.today(),
+        )
+        for asset, schedule in zip(assets, schedules)
+    ]
+    try:
+        async with in_transaction() as conn:
+            await DepreciationHistory.filter(
+                _current_versions(policies), asset_id__in=[asset.id for asset in assets]
+            ).using_db(conn).delete()
+            await DepreciationHistory.bulk_create(rows, using_db=conn)
+    except IntegrityError:
+        # A concurrent request stored the same schedules first
+        pass
+
+
+async def _get_chunk(assets, policies):
+    stored = {
+        row["asset_id"]: row
+        for row in await DepreciationHistory.filter(
+            _current_versions(policies), asset_id__in=[asset.id for asset in assets]
+        ).values("asset_id", "fingerprint", "depreciation")
+    }
+    stale = [
+        asset for asset in assets
+        if asset.id not in stored
+        or stored[asset.id]["fingerprint"] != fingerprint(asset, policies[asset.category])
+    ]
+    if stale:
+        schedules = build_schedules(stale, policies)
+        await _store(stale, schedules, policies)
+        for asset, schedule in zip(stale, schedules):
+            stored[asset.id] = {"depreciation": schedule}
+    return [_payload(asset, stored[asset.id]["depreciation"]) for asset in assets]
+
+
+async def get_schedules(assets, policies):
+    """
+    Depreciation schedules for `assets` in the API response format.
+
+    Up-to-date schedules are read from DepreciationHistory; missing or stale
+    ones are recomputed in one engine batch per chunk and stored.
+    """
+    data = []
+    for start in range(0, len(assets), CHUNK_SIZE):
+        data.extend(await _get_chunk(assets[start:start + CHUNK_SIZE], policies))
+    return data
@@ -0,0 +1,244 @@
+"""
+Benchmark: the vectorized depreciation engine against two baselines.
+
+1. Synthetic, no database: a pure-Python per-asset loop computing the
+   engine's own schedules (same math, in-memory policies) vs
+   `build_schedules`. This isolates the cost of the arithmetic.
+2. Route path, on a seeded database (in-memory SQLite by default): the
+   fleet schedule route exactly as it was before the engine, with one
+   Depreciation query per asset, vs the current path (one policy query +
+   `build_schedules`). The old route read `Asset.depreciation_method`,
+   which only exists since the engine change, and its declining-balance
+   branch raises TypeError (Decimal * float), so it is run on today's
+   model with straight-line assets only, the one case it could serve.
+
+Run from the project root:
+
+    python -m benchmarks.bench_depreciation_engine --assets 50000 --db-assets 5000
+"""
+import argparse
+import asyncio
+import datetime
+import random
+import time
+from types import SimpleNamespace
+
+from fastapi import HTTPException
+from tortoise import Tortoise
+
+from app.database import TORTOISE_ORM
+from app.models.assets import Asset, DepreciationMethod
+from app.models.company import Company, Location
+from app.models.depreciation import Depreciation
+from app.services.depreciation_engine import build_schedules
+
+CATEGORIES = {
+    "vehicle": SimpleNamespace(residual_value=2000, useful_life_ifrs=8, useful_life_tax=5),
+    "it_equipment": SimpleNamespace(residual_value=100, useful_life_ifrs=4, useful_life_tax=3),
+    "furniture": SimpleNamespace(residual_value=50, useful_life_ifrs=10, useful_life_tax=7),
+    "office_equipment": SimpleNamespace(residual_value=80, useful_life_ifrs=6, useful_life_tax=5),
+    "manufacturing_equipment": SimpleNamespace(residual_value=5000, useful_life_ifrs=15, useful_life_tax=10),
+}
+
+
+def make_assets(count, seed=7):
+    rng = random.Random(seed)
+    methods = [DepreciationMethod.STRAIGHT_LINE, DepreciationMethod.DECLINING_BALANCE]
+    return [
+        SimpleNamespace(
+            id=i,
+            name=f"Asset {i}",
+            category=rng.choice(list(CATEGORIES)),
+            purchase_price=round(rng.uniform(500, 150000), 2),
+            depreciation_method=rng.choice(methods),
+        )
+        for i in range(count)
+    ]
+
+
+def python_loop(assets, policies):
+    """
+    Synthetic pure-Python baseline: the engine's schedules (same declining
+    balance math and output shape) computed per asset and per year, from
+    in-memory policies. Not the old route code; see `baseline_route`.
+    """
+    data = []
+    for asset in assets:
+        depreciation = policies[asset.category]
+        annual_ifrs, monthly_ifrs, annual_tax, monthly_tax = [], [], [], []
+        price = asset.purchase_price
+        residual_value = depreciation.residual_value
+        life_ifrs = int(depreciation.useful_life_ifrs)
+        life_tax = int(depreciation.useful_life_tax)
+        if asset.depreciation_method == DepreciationMethod.STRAIGHT_LINE:
+            value = (price - residual_value) / life_ifrs
+            for i in range(life_ifrs):
+                annual_ifrs.append({f"{i+1}_year": round(value, 2)})
+                monthly_ifrs.append({f"{i+1}_month": round(value / 12, 2)})
+            value = (price - residual_value) / life_tax
+            for i in range(life_tax):
+                annual_tax.append({f"{i+1}_year": round(value, 2)})
+                monthly_tax.append({f"{i+1}_month": round(value / 12, 2)})
+        else:
+            for book_life, annual, monthly in ((life_ifrs, annual_ifrs, monthly_ifrs), (life_tax, annual_tax, monthly_tax)):
+                book_value = price
+                for i in range(book_life):
+                    value = max(book_value * 2 / book_life, 0)
+                    if book_value - value < residual_value or i == book_life - 1:
+                        value = max(book_value - residual_value, 0)
+                    book_value -= value
+                    annual.append({f"{i+1}_year": round(value, 2)})
+                    monthly.append({f"{i+1}_month": round(value / 12, 2)})
+        data.append({
+            "asset_id": asset.id,
+            "asset_name": asset.name,
+            "asset_category": asset.category,
+            "depreciation_method": asset.depreciation_method,
+            "depreciation_ifrs": {"annual_depreciation_ifrs": annual_ifrs, "monthly_depreciation_ifrs": monthly_ifrs},
+            "depreciation_tax": {"annual_depreciation_tax": annual_tax, "monthly_depreciation_tax": monthly_tax},
+        })
+    return data
+
+
+async def baseline_route():
+    """
+    The fleet schedule route (`GET /finance/depreciation-schedule/`) as of
+    the commit before the engine, verbatim except for its final
+    `DepreciationHistory.create(depreciation_data)`, which raises on a list
+    and so never completed.
+    """
+    data = []
+    depreciation_data = []
+    currentDate = datetime.datetime.now()
+    assets = await Asset.all()
+    for asset in assets:
+        annual_depreciation_ifrs = []
+        monthly_depreciation_ifrs = []
+        annual_depreciation_tax = []
+        monthly_depreciation_tax = []
+        depreciation = await Depreciation.get_or_none(category=asset.category)
+        if not depreciation:
+            raise HTTPException(status_code=404, detail="Depreciation not found")
+
+        purchase_price = asset.purchase_price
+        residual_value = depreciation.residual_value
+        useful_life_ifrs = int(depreciation.useful_life_ifrs)
+        depreciation_rate_ifrs = 2 / useful_life_ifrs
+        useful_life_tax = int(depreciation.useful_life_tax)
+        depreciation_rate_tax = 2 / useful_life_tax
+        if asset.depreciation_method == "straight_line":
+            annual_depreciation_ifrs_value = (purchase_price - residual_value) / useful_life_ifrs
+            for i in range(useful_life_ifrs):
+                annual_depreciation_ifrs.append({f"{i+1}_year": round(annual_depreciation_ifrs_value, 2)})
+                monthly_depreciation_ifrs.append({f"{i+1}_month": round(annual_depreciation_ifrs_value / 12, 2)})
+            annual_depreciation_tax_value = (purchase_price - residual_value) / useful_life_tax
+            for i in range(useful_life_tax):
+                annual_depreciation_tax.append({f"{i+1}_year": round(annual_depreciation_tax_value, 2)})
+                monthly_depreciation_tax.append({f"{i+1}_month": round(annual_depreciation_tax_value / 12, 2)})
+
+        else :
+            for i in range(useful_life_ifrs):
+                annual_depreciation_ifrs_value = purchase_price * depreciation_rate_ifrs / useful_life_ifrs
+                purchase_price = purchase_price - annual_depreciation_ifrs_value
+                annual_depreciation_ifrs.append({f"{i}year": round(annual_depreciation_ifrs_value, 2)})
+                monthly_depreciation_ifrs.append({f"{i}month": round(annual_depreciation_ifrs_value / 12, 2)})
+            for i in range(useful_life_tax):
+                annual_depreciation_tax_value = purchase_price * depreciation_rate_tax / useful_life_tax
+                purchase_price = purchase_price - annual_depreciation_tax_value
+                annual_depreciation_tax.append({f"{i}year": round(annual_depreciation_tax_value, 2)})
+                monthly_depreciation_tax.append({f"{i}month": round(annual_depreciation_tax_value / 12, 2)})
+
+        data.append({
+            "asset_name": asset.name,
+            "asset_category": asset.category,
+            "depreciation_method": asset.depreciation_method,
+            "depreciation_ifrs": {
+                "annual_depreciation_ifrs": annual_depreciation_ifrs,
+                "monthly_depreciation_ifrs": monthly_depreciation_ifrs
+            },
+            "depreciation_tax": {
+                "annual_depreciation_tax": annual_depreciation_tax,
+                "monthly_depreciation_tax": monthly_depreciation_tax
+            }
+        })
+        depreciation_data.append({
+            "asset_id": asset.id,
+            "update_date": asset.purchase_date,
+            "update_date": currentDate
+        })
+    return data
+
+
+async def engine_route():
+    """The current route's computation: one policy query, then one engine batch."""
+    assets = await Asset.all()
+    policies = {policy.category: policy for policy in await Depreciation.all()}
+    return build_schedules(assets, policies)
+
+
+async def time_routes(db_url, count, repeat):
+    await Tortoise.init(config={**TORTOISE_ORM, "connections": {"default": db_url}})
+    try:
+        await Tortoise.generate_schemas()
+        company = await Company.create(name="Benchmark Co")
+        location = await Location.create(company=company, name="HQ", code="HQ", country="DE", city="Berlin", address="-")
+        await Depreciation.bulk_create([
+            Depreciation(category=category, **vars(policy)) for category, policy in CATEGORIES.items()
+        ])
+        await Asset.bulk_create([
+            Asset(
+                asset_id=f"BENCH-{asset.id:06d}", company=company, location=location, name=asset.name,
+                category=asset.category, department="Finance", assigned="Jane Doe",
+                purchase_price=asset.purchase_price, purchase_date=datetime.date(2022, 1, 1),
+                depreciation_method=DepreciationMethod.STRAIGHT_LINE,
+            )
+            for asset in make_assets(count)
+        ], batch_size=1000)
+
+        timings = []
+        for route in (baseline_route, engine_route):
+            best = float("inf")
+            for _ in range(repeat):
+                started = time.perf_counter()
+                await route()
+                best = min(best, time.perf_counter() - started)
+            timings.append(best)
+        return timings
+    finally:
+        await Tortoise.close_connections()
+
+
+def best_of(repeat, func, *args):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--db-assets", type=int, default=5000, help="assets seeded for the route comparison (0 to skip)")
+    parser.add_argument("--db-url", default="sqlite://:memory:", help="empty database to seed (default: in-memory SQLite)")
+    args = parser.parse_args()
+
+    assets = make_assets(args.assets)
+    loop = best_of(args.repeat, python_loop, assets, CATEGORIES)
+    engine = best_of(args.repeat, build_schedules, assets, CATEGORIES)
+
+    print(f"synthetic, {args.assets} assets (no database)")
+    print(f"  pure-Python loop: {loop * 1000:9.1f} ms")
+    print(f"  engine:           {engine * 1000:9.1f} ms  ({loop / engine:.1f}x)")
+
+    if args.db_assets:
+        baseline, current = asyncio.run(time_routes(args.db_url, args.db_assets, args.repeat))
+        print(f"route path, {args.db_assets} assets on {args.db_url}")
+        print(f"  pre-engine route: {baseline * 1000:9.1f} ms")
+        print(f"  engine route:     {current * 1000:9.1f} ms  ({baseline / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
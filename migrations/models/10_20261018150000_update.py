@@ -0,0 +1,16 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "idsequence" (
+    "name" VARCHAR(50) NOT NULL PRIMARY KEY,
+    "next_value" BIGINT NOT NULL
+);
+INSERT INTO "idsequence" ("name", "next_value") VALUES ('asset', 10000), ('vendor', 10000), ('maintenance', 10000)
+    ON CONFLICT ("name") DO NOTHING;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "idsequence";"""
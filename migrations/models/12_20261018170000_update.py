@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "asset" ADD "updated_at" TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "location" ADD "updated_at" TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "depreciation" ADD "updated_at" TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "asset" DROP COLUMN "updated_at";
+ALTER TABLE "location" DROP COLUMN "updated_at";
+ALTER TABLE "depreciation" DROP COLUMN "updated_at";"""
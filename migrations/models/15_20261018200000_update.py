@@ -0,0 +1,26 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "maintenancecostrollup" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "vendor_id" INT NOT NULL DEFAULT 0,
+    "month" DATE NOT NULL,
+    "total_cost" DECIMAL(14,2) NOT NULL DEFAULT 0,
+    "task_count" INT NOT NULL DEFAULT 0,
+    "asset_id" INT NOT NULL REFERENCES "asset" ("id") ON DELETE CASCADE,
+    "company_id" INT NOT NULL REFERENCES "company" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_maintenance_company_c5d09f" UNIQUE ("company_id", "asset_id", "vendor_id", "month")
+);
+CREATE INDEX IF NOT EXISTS "idx_maintenance_company_5b9830" ON "maintenancecostrollup" ("company_id", "month");
+CREATE INDEX IF NOT EXISTS "idx_maintenance_company_f57dbd" ON "maintenancecostrollup" ("company_id", "vendor_id");
+INSERT INTO "maintenancecostrollup" ("company_id", "asset_id", "vendor_id", "month", "total_cost", "task_count")
+SELECT "company_id", "asset_id", COALESCE("vendor_id", 0), date_trunc('month', "scheduled_date")::date, SUM("cost"), COUNT(*)
+FROM "maintenance"
+GROUP BY 1, 2, 3, 4;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "maintenancecostrollup";"""
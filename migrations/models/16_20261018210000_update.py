@@ -0,0 +1,18 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "changeversion" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "resource" VARCHAR(30) NOT NULL,
+    "company_id" INT NOT NULL,
+    "version" BIGINT NOT NULL DEFAULT 0,
+    "modified_at" TIMESTAMPTZ NOT NULL,
+    CONSTRAINT "uid_changeversi_resourc_8007f6" UNIQUE ("resource", "company_id")
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "changeversion";"""
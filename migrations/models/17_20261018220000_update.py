@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "depreciationjob" ADD "owner" VARCHAR(32);
+ALTER TABLE "depreciationjob" ADD "heartbeat_at" TIMESTAMPTZ;
+CREATE INDEX IF NOT EXISTS "idx_depreciatio_status_a660f2" ON "depreciationjob" ("status", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_depreciatio_status_a660f2";
+ALTER TABLE "depreciationjob" DROP COLUMN "heartbeat_at";
+ALTER TABLE "depreciationjob" DROP COLUMN "owner";"""
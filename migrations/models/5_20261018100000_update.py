@@ -0,0 +1,11 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "asset" ADD "depreciation_method" VARCHAR(30) NOT NULL DEFAULT 'straight_line';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "asset" DROP COLUMN "depreciation_method";"""
@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "depreciation" ADD "version" INT NOT NULL DEFAULT 1;
+DROP TABLE IF EXISTS "depreciationhistory";
+CREATE TABLE IF NOT EXISTS "depreciationhistory" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "category" VARCHAR(50) NOT NULL,
+    "policy_version" INT NOT NULL,
+    "fingerprint" VARCHAR(40) NOT NULL,
+    "depreciation" JSONB NOT NULL,
+    "update_date" DATE NOT NULL,
+    "asset_id" INT NOT NULL REFERENCES "asset" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_depreciatio_asset_i_category_version" UNIQUE ("asset_id", "category", "policy_version")
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "depreciationhistory";
+ALTER TABLE "depreciation" DROP COLUMN "version";"""
@@ -0,0 +1,22 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "depreciationjob" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "status" VARCHAR(20) NOT NULL DEFAULT 'queued',
+    "total" INT NOT NULL DEFAULT 0,
+    "processed" INT NOT NULL DEFAULT 0,
+    "skipped" INT NOT NULL DEFAULT 0,
+    "error" TEXT,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "started_at" TIMESTAMPTZ,
+    "finished_at" TIMESTAMPTZ,
+    "company_id" INT NOT NULL REFERENCES "company" ("id") ON DELETE CASCADE
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "depreciationjob";"""
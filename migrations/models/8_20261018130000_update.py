@@ -0,0 +1,20 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "depreciationposting" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "period" DATE NOT NULL,
+    "amount_ifrs" DECIMAL(12,2) NOT NULL,
+    "amount_tax" DECIMAL(12,2) NOT NULL,
+    "posted_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "asset_id" INT NOT NULL REFERENCES "asset" ("id") ON DELETE CASCADE,
+    "company_id" INT NOT NULL REFERENCES "company" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_depreciatio_asset_i_period" UNIQUE ("asset_id", "period")
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "depreciationposting";"""
@@ -0,0 +1,31 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_asset_company_a6b1f3" ON "asset" ("company_id", "id");
+CREATE INDEX IF NOT EXISTS "idx_asset_company_6856dd" ON "asset" ("company_id", "status");
+CREATE INDEX IF NOT EXISTS "idx_asset_company_cd5a88" ON "asset" ("company_id", "category");
+CREATE INDEX IF NOT EXISTS "idx_asset_company_e85264" ON "asset" ("company_id", "location_id");
+CREATE INDEX IF NOT EXISTS "idx_asset_company_341bbd" ON "asset" ("company_id", "purchase_date");
+CREATE INDEX IF NOT EXISTS "idx_maintenance_asset_i_fe7147" ON "maintenance" ("asset_id", "scheduled_date");
+CREATE INDEX IF NOT EXISTS "idx_assettransf_asset_i_a5ec8f" ON "assettransfer" ("asset_id", "transfer_date");
+CREATE INDEX IF NOT EXISTS "idx_assettransf_company_2a26b4" ON "assettransfer" ("company_id", "transfer_date");
+CREATE INDEX IF NOT EXISTS "idx_assetdispos_asset_i_f872a2" ON "assetdisposal" ("asset_id", "disposal_date");
+CREATE INDEX IF NOT EXISTS "idx_assetdispos_company_997ca8" ON "assetdisposal" ("company_id", "disposal_date");
+CREATE INDEX IF NOT EXISTS "idx_depreciatio_company_bfc121" ON "depreciationposting" ("company_id", "period");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_asset_company_a6b1f3";
+DROP INDEX IF EXISTS "idx_asset_company_6856dd";
+DROP INDEX IF EXISTS "idx_asset_company_cd5a88";
+DROP INDEX IF EXISTS "idx_asset_company_e85264";
+DROP INDEX IF EXISTS "idx_asset_company_341bbd";
+DROP INDEX IF EXISTS "idx_maintenance_asset_i_fe7147";
+DROP INDEX IF EXISTS "idx_assettransf_asset_i_a5ec8f";
+DROP INDEX IF EXISTS "idx_assettransf_company_2a26b4";
+DROP INDEX IF EXISTS "idx_assetdispos_asset_i_f872a2";
+DROP INDEX IF EXISTS "idx_assetdispos_company_997ca8";
+DROP INDEX IF EXISTS "idx_depreciatio_company_bfc121";"""